@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import babel.dates
+
+from fyyur.formatting import FORMATS, format_datetime, format_datetimes
+from shows_render import legacy_format_datetime
+
+
+def best_of(repeat, function):
+    # Best wall time of several runs, in milliseconds
+    timings = list()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare the datetime filter implementations.')
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    start = datetime.now(timezone.utc)
+    values = [start + timedelta(minutes=i) for i in range(args.count)]
+    strings = [f'{value.replace(tzinfo=None)}Z' for value in values]
+
+    results = {
+        'legacy filter (strings)': lambda: [legacy_format_datetime(value, 'full') for value in strings],
+        'babel per call': lambda: [babel.dates.format_datetime(value, FORMATS['full']) for value in values],
+        'format_datetime': lambda: [format_datetime(value, 'full') for value in values],
+        'format_datetimes': lambda: format_datetimes(values, 'full'),
+    }
+    print(f'{args.count} timestamps')
+    for name, function in results.items():
+        print(f'  {name:<24} {best_of(args.repeat, function):9.2f} ms')
@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from fyyur.exporter import generate_export
+from seed import seed
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure peak Python memory while exporting all shows.')
+    parser.add_argument('--shows', type=int, default=1000000)
+    parser.add_argument('--format', choices=['csv', 'ndjson'], default='ndjson')
+    parser.add_argument('--no-seed', action='store_true', help='reuse the data already in the database')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if not args.no_seed:
+            seed(shows=args.shows)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        rows = size = 0
+        for chunk in generate_export('shows', args.format, app.config['EXPORT_BATCH_SIZE']):
+            rows += chunk.count('\n')
+            size += len(chunk)
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f'{rows} lines, {size / 2 ** 20:.1f} MiB exported in {elapsed:.2f} s')
+    print(f'  peak traced memory {peak / 2 ** 20:.2f} MiB')
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import render_template
+
+from app import app
+from fyyur.cache import SimpleCache
+from fyyur.viewmodels import Tile, VenueArea
+
+
+def make_areas(tiles, per_area=50):
+    venues = [Tile(i, f'Venue {i}', 0, 1) for i in range(tiles)]
+    return [VenueArea(f'City {i // per_area}', 'CA', venues[i:i + per_area]) for i in range(0, tiles, per_area)]
+
+
+def time_render(areas, repeat):
+    # Best of several renders of /venues, in milliseconds
+    timings = list()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render_template('pages/venues.html', areas=areas)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def edit_one(areas):
+    # The same page after one venue was edited, i.e. with its version bumped
+    venue = areas[0].venues[0]
+    first = areas[0]._replace(venues=[venue._replace(version=venue.version + 1)] + areas[0].venues[1:])
+    return [first] + areas[1:]
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render /venues without and with the tile fragment cache.')
+    parser.add_argument('--tiles', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    areas = make_areas(args.tiles)
+    with app.test_request_context('/venues'):
+        app.jinja_env.fragment_cache = None
+        uncached = time_render(areas, args.repeat)
+
+        app.jinja_env.fragment_cache = store = SimpleCache(threshold=args.tiles * 2)
+        started = time.perf_counter()
+        render_template('pages/venues.html', areas=areas)
+        cold = (time.perf_counter() - started) * 1000
+        warm = time_render(areas, args.repeat)
+
+        edited = edit_one(areas)
+        started = time.perf_counter()
+        render_template('pages/venues.html', areas=edited)
+        one_edit = (time.perf_counter() - started) * 1000
+
+    print(f'{args.tiles} tiles')
+    print(f'  no fragment cache  {uncached:9.2f} ms')
+    print(f'  cold cache         {cold:9.2f} ms')
+    print(f'  warm cache         {warm:9.2f} ms')
+    print(f'  after one edit     {one_edit:9.2f} ms')
@@ -0,0 +1,202 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist
+from seed import zipf_weights, GENRES, STATES
+
+# Relative frequency of each user flow; detail pages of popular venues and artists are visited most
+FLOWS = {
+    'listing': 30,
+    'search': 20,
+    'detail': 40,
+    'create': 5,
+    'edit': 5,
+}
+SEARCH_TERMS = ['a', 'venue 1', 'artist 2', 'jazz', 'city 1', 'ca', 'rock', 'city 12, ca']
+PERCENTILES = (50, 95, 99)
+
+
+class TestClient:
+    # Requests served in-process by the Flask test client
+
+    def __init__(self):
+        self.client = app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data, follow_redirects=True)
+        return response.status_code, response.data
+
+
+class HTTPClient:
+    # Requests sent to a running server
+
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data, doseq=True).encode() if data is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.url + path, body, method=method)) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+
+def venue_form(rng, name):
+    return {
+        'name': name, 'city': f'City {rng.randrange(200)}', 'state': rng.choice(STATES),
+        'address': '1 Main Street', 'phone': '555-555-5555', 'genres': rng.sample(GENRES, 2),
+        'image_link': 'https://example.com/venue.png', 'facebook_link': 'https://facebook.com/venue',
+        'website': 'https://example.com', 'seeking_description': '',
+    }
+
+
+def artist_form(rng, name):
+    return {
+        'name': name, 'city': f'City {rng.randrange(200)}', 'state': rng.choice(STATES),
+        'phone': '555-555-5555', 'genres': rng.sample(GENRES, 2),
+        'image_link': 'https://example.com/artist.png', 'facebook_link': 'https://facebook.com/artist',
+        'website': 'https://example.com', 'seeking_description': '',
+    }
+
+
+def flow_requests(flow, rng, ids):
+    # (endpoint, method, path, form data) requests of one user flow
+    kind = rng.choice(['venues', 'artists'])
+    id = rng.choices(ids[kind], cum_weights=ids[kind + '_weights'])[0]
+    form = venue_form if kind == 'venues' else artist_form
+
+    if flow == 'listing':
+        kind = rng.choice(['venues', 'artists', 'shows'])
+        return [(f'GET /{kind}', 'GET', f'/{kind}', None)]
+    if flow == 'search':
+        return [(f'POST /{kind}/search', 'POST', f'/{kind}/search', {'search_term': rng.choice(SEARCH_TERMS)})]
+    if flow == 'detail':
+        return [(f'GET /{kind}/<id>', 'GET', f'/{kind}/{id}', None)]
+    if flow == 'create':
+        if rng.random() < 0.5:
+            start_time = datetime.utcnow() + timedelta(minutes=rng.randrange(365 * 24 * 60))
+            show = {'artist_id': rng.choice(ids['artists']), 'venue_id': rng.choice(ids['venues']),
+                    'start_time': start_time.strftime('%Y-%m-%d %H:%M:%S')}
+            return [('POST /shows/create', 'POST', '/shows/create', show)]
+        return [(f'POST /{kind}/create', 'POST', f'/{kind}/create', form(rng, f'Bench {rng.randrange(10 ** 9)}'))]
+    # edit: load the form, then submit it; the submission redirects to the detail page
+    return [
+        (f'GET /{kind}/<id>/edit', 'GET', f'/{kind}/{id}/edit', None),
+        (f'POST /{kind}/<id>/edit', 'POST', f'/{kind}/{id}/edit', form(rng, f'Edited {id}')),
+    ]
+
+
+def worker(client, ids, duration, timings, errors, seed):
+    rng = random.Random(seed)
+    flows, weights = list(FLOWS), list(FLOWS.values())
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        for endpoint, method, path, data in flow_requests(rng.choices(flows, weights)[0], rng, ids):
+            started = time.perf_counter()
+            status, body = client.request(method, path, data)
+            timings[endpoint].append((time.perf_counter() - started) * 1000)
+            # The form controllers report failures with a flashed message, not a status code
+            if status >= 400 or b'Oops!' in body:
+                errors.append(endpoint)
+
+
+def percentile(timings, p):
+    return timings[min(len(timings) - 1, int(len(timings) * p / 100))]
+
+
+def summarize(timings, errors, duration):
+    errors = Counter(errors)
+    results = dict()
+    for endpoint, values in sorted(timings.items()):
+        values.sort()
+        results[endpoint] = {
+            'requests': len(values),
+            'errors': errors[endpoint],
+            'throughput': round(len(values) / duration, 2),
+            **{f'p{p}': round(percentile(values, p), 3) for p in PERCENTILES},
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # Regressions of more than tolerance (a fraction) in p95 latency or throughput against the baseline
+    regressions = list()
+    for endpoint, expected in baseline['endpoints'].items():
+        actual = results['endpoints'].get(endpoint)
+        if actual is None:
+            continue
+        if actual['p95'] > expected['p95'] * (1 + tolerance):
+            regressions.append(f"{endpoint}: p95 {actual['p95']:.2f} ms, baseline {expected['p95']:.2f} ms")
+        if actual['throughput'] < expected['throughput'] * (1 - tolerance):
+            regressions.append(f"{endpoint}: {actual['throughput']:.1f} req/s, baseline {expected['throughput']:.1f} req/s")
+    return regressions
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Replay listing, search, detail, create and edit flows against a seeded database (see seed.py) '
+                    'and report throughput and p50/p95/p99 latency per endpoint.')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--skew', type=float, default=1.0, help='Zipf exponent of venue/artist page popularity; 0 is uniform.')
+    parser.add_argument('--url', help='Base URL of a running server; requests are served in-process by default.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Fail if the results regress against this JSON results file.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression against the baseline, as a fraction.')
+    args = parser.parse_args()
+
+    with app.app_context():
+        ids = {
+            'venues': [id for id, in db.session.query(Venue.id).order_by(Venue.id)],
+            'artists': [id for id, in db.session.query(Artist.id).order_by(Artist.id)],
+        }
+    ids['venues_weights'] = zipf_weights(len(ids['venues']), args.skew)
+    ids['artists_weights'] = zipf_weights(len(ids['artists']), args.skew)
+
+    timings, errors = defaultdict(list), list()
+    threads = [threading.Thread(target=worker, args=(
+        HTTPClient(args.url) if args.url else TestClient(), ids, args.duration, timings, errors, i))
+        for i in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    results = {
+        'threads': args.threads,
+        'duration': args.duration,
+        'skew': args.skew,
+        'endpoints': summarize(timings, errors, args.duration),
+    }
+
+    print(f"{'endpoint':28} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, row in results['endpoints'].items():
+        print(f"{endpoint:28} {row['requests']:9} {row['errors']:7} {row['throughput']:8.1f} "
+              f"{row['p50']:9.2f} {row['p95']:9.2f} {row['p99']:9.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        sys.exit(1 if regressions else 0)
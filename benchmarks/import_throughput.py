@@ -0,0 +1,45 @@
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from fyyur.importer import import_stream
+from seed import seed
+
+
+def show_lines(count, venue_ids, artist_ids):
+    # NDJSON show rows one minute apart, so none of them collide
+    rng = random.Random(2)
+    start = datetime(2030, 1, 1)
+    for i in range(count):
+        yield json.dumps({
+            'artist_id': rng.choice(artist_ids),
+            'venue_id': rng.choice(venue_ids),
+            'start_time': (start + timedelta(minutes=i)).strftime('%Y-%m-%d %H:%M:%S'),
+        }) + '\n'
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure bulk show import throughput.')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with app.app_context():
+        venue_ids, artist_ids = seed(venues=200, artists=500, shows=0)
+        stream = io.StringIO(''.join(show_lines(args.rows, venue_ids, artist_ids)))
+
+        started = time.perf_counter()
+        result = import_stream('shows', stream, 'ndjson', args.chunk_size)
+        elapsed = time.perf_counter() - started
+
+    print(f'{result.inserted} rows imported, {len(result.errors)} rejected in {elapsed:.2f} s')
+    print(f'  {result.inserted / elapsed:,.0f} rows/sec with chunks of {args.chunk_size}')
@@ -0,0 +1,85 @@
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What each gunicorn worker does when it starts (without preload_app): import wsgi.py, which
+# creates the app
+STARTUP = 'import time; started = time.perf_counter(); import wsgi; print(time.perf_counter() - started)'
+
+# Heavy libraries that are only imported on first use and must stay out of start-up
+LAZY = ('alembic', 'babel', 'dateutil', 'mako', 'pygments', 'wtforms')
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+\d+ \| *(\S+)$')
+
+
+def measure_startup(env):
+    # Seconds spent in create_app(), and the import time in microseconds of each package (the
+    # time spent in its own modules, excluding what they import from other packages), from one
+    # fresh interpreter run with -X importtime
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', STARTUP],
+                             cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    packages = defaultdict(int)
+    for line in process.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            packages[match.group(2).split('.')[0]] += int(match.group(1))
+    return float(process.stdout.split()[-1]), packages
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Start-up cost of a worker: time to import wsgi.py, i.e. the fyyur package and create_app(), '
+                    'with the packages that take the longest to import (python -X importtime).')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreter runs; the median is reported.')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest packages to list.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Fail if start-up is slower than in this JSON results file.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression against the baseline, as a fraction.')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault('SECRET_KEY', 'benchmark')
+
+    startups, imports = list(), defaultdict(list)
+    for _ in range(args.repeat):
+        seconds, packages = measure_startup(env)
+        startups.append(seconds * 1000)
+        for name, microseconds in packages.items():
+            imports[name].append(microseconds / 1000)
+
+    imports = {name: statistics.median(values) for name, values in imports.items()}
+    results = {
+        'startup_ms': round(statistics.median(startups), 2),
+        'import_ms': round(sum(imports.values()), 2),
+        'packages': len(imports),
+        'lazy_imported': sorted(name for name in imports if name in LAZY),
+        'slowest_packages': {name: round(ms, 2) for name, ms in sorted(imports.items(), key=lambda item: -item[1])[:args.top]},
+    }
+
+    print(f"create_app() start-up    {results['startup_ms']:9.2f} ms (median of {args.repeat})")
+    print(f"imports                  {results['import_ms']:9.2f} ms in {results['packages']} packages")
+    for name, ms in results['slowest_packages'].items():
+        print(f'  {name:22} {ms:9.2f} ms')
+    if results['lazy_imported']:
+        print(f"imported at start-up but meant to be lazy: {', '.join(results['lazy_imported'])}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    failed = bool(results['lazy_imported'])
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if results['startup_ms'] > baseline['startup_ms'] * (1 + args.tolerance):
+            print(f"REGRESSION start-up {results['startup_ms']:.2f} ms, baseline {baseline['startup_ms']:.2f} ms", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,57 @@
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from fyyur.extensions import db
+
+# Read-heavy mix of pages, run against an already seeded database (see seed.py)
+SEARCH_TERMS = ['a', 'venue 1', 'artist 2', 'jazz', 'city 12', 'ca']
+
+
+def worker(duration, timings, errors, seed):
+    rng = random.Random(seed)
+    client = app.test_client()
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        kind = rng.choice(['venues', 'artists'])
+        started = time.perf_counter()
+        response = client.post(f'/{kind}/search', data={'search_term': rng.choice(SEARCH_TERMS)})
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Drive concurrent searches and report throughput, latency and pool statistics. '
+                    'Tune the pool with the DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT and '
+                    'DB_STATEMENT_TIMEOUT_MS environment variables.')
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=30)
+    args = parser.parse_args()
+
+    timings, errors = list(), list()
+    threads = [threading.Thread(target=worker, args=(args.duration, timings, errors, i)) for i in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    timings.sort()
+    with app.app_context():
+        stats = db.engine.pool.stats()
+
+    options = app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    print(f"pool_size={options['pool_size']} max_overflow={options['max_overflow']} threads={args.threads}")
+    print(f'  {len(timings) / args.duration:8.1f} requests/sec, {len(errors)} errors')
+    print(f'  p50 {statistics.median(timings):8.2f} ms   p99 {timings[int(len(timings) * 0.99)]:8.2f} ms')
+    print(f"  pool waits: avg {stats['wait_seconds_avg'] * 1000:.2f} ms, max {stats['wait_seconds_max'] * 1000:.2f} ms, "
+          f"{stats['failed_checkouts']} failed checkouts")
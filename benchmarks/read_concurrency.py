@@ -0,0 +1,98 @@
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from http_flows import HTTPClient, SEARCH_TERMS, summarize
+from serving import wait_until_up
+
+# The read endpoints that wait on Postgres: COUNT and ILIKE searches, and the listings
+READS = [
+    ('POST', '/venues/search', lambda rng: {'search_term': rng.choice(SEARCH_TERMS)}),
+    ('POST', '/artists/search', lambda rng: {'search_term': rng.choice(SEARCH_TERMS)}),
+    ('GET', '/venues', lambda rng: None),
+    ('GET', '/shows', lambda rng: None),
+]
+
+
+def single_worker(port, worker_class, threads, connections):
+    # One gunicorn worker process, so that its concurrency is all that is measured. Its pool
+    # is sized for the most requests it can have in flight.
+    env = dict(os.environ, FYYUR_ENV='production', GUNICORN_BIND=f'127.0.0.1:{port}', WEB_CONCURRENCY='1',
+               GUNICORN_WORKER_CLASS=worker_class, GUNICORN_THREADS=str(threads),
+               GUNICORN_WORKER_CONNECTIONS=str(connections), DB_POOL_SIZE=str(connections), DB_MAX_OVERFLOW='0')
+    env.setdefault('SECRET_KEY', 'benchmark')
+    return subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def reader(client, duration, timings, errors, seed):
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        method, path, data = rng.choice(READS)
+        started = time.perf_counter()
+        try:
+            status, _ = client.request(method, path, data(rng))
+        except OSError:  # refused or reset
+            status = None
+        timings[path].append((time.perf_counter() - started) * 1000)
+        if status != 200:
+            errors.append(path)
+
+
+def run_load(url, clients, duration):
+    timings, errors = defaultdict(list), list()
+    threads = [threading.Thread(target=reader, args=(HTTPClient(url), duration, timings, errors, i))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    merged = [value for values in timings.values() for value in values]
+    return summarize({'all': merged}, ['all'] * len(errors), duration)['all']
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Concurrency scaling of the read endpoints (venue and artist search, /venues, /shows) '
+                    'served by a single gunicorn worker: gthread, which holds a thread per request while '
+                    'Postgres runs its queries, versus gevent, with psycopg2 in asynchronous mode. '
+                    'Run it against a seeded local Postgres (see seed.py and DATABASE_URL).')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 4, 16, 64], help='Concurrent client levels.')
+    parser.add_argument('--duration', type=float, default=15, help='Seconds per level.')
+    parser.add_argument('--threads', type=int, default=4, help='Threads of the gthread worker.')
+    parser.add_argument('--connections', type=int, default=64,
+                        help='Greenlets of the gevent worker, and pool size of both workers.')
+    parser.add_argument('--port', type=int, default=5200, help='The servers listen on this port and the next.')
+    args = parser.parse_args()
+
+    servers = [
+        (f'gthread x{args.threads}', args.port, 'gthread'),
+        (f'gevent x{args.connections}', args.port + 1, 'gevent'),
+    ]
+    results = dict()
+    for name, port, worker_class in servers:
+        url = f'http://127.0.0.1:{port}'
+        process = single_worker(port, worker_class, args.threads, args.connections)
+        try:
+            wait_until_up(url)
+            for clients in args.clients:
+                results[name, clients] = run_load(url, clients, args.duration)
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f'one worker process, {args.duration:g} s per level')
+    print(f"{'worker':14} {'clients':>8} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for (name, clients), row in results.items():
+        print(f"{name:14} {clients:8} {row['requests']:9} {row['errors']:7} {row['throughput']:8.1f} "
+              f"{row['p50']:9.2f} {row['p95']:9.2f} {row['p99']:9.2f}")
@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app import app
+from fyyur.counters import counter_drift, fix_drift
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist, Show
+
+GENRES = ['Alternative', 'Blues', 'Classical', 'Country', 'Electronic', 'Folk', 'Funk', 'Hip-Hop', 'Jazz', 'Pop', 'Rock n Roll', 'Soul']
+STATES = ['CA', 'NY', 'TX', 'WA', 'IL', 'LA', 'FL', 'CO']
+CITIES = 200
+
+
+def zipf_weights(count, skew):
+    # Cumulative weights giving the i-th item a share proportional to 1 / (i + 1) ** skew; 0 is uniform
+    weights = list()
+    total = 0.0
+    for rank in range(count):
+        total += 1 / (rank + 1) ** skew
+        weights.append(total)
+    return weights
+
+
+def seed(venues=2000, artists=5000, shows=1000000, batch_size=10000, skew=1.0):
+    # Populate the database with synthetic venues, artists and shows. With skew > 0 a few big
+    # cities hold most venues and artists, and the first venues and artists get most shows.
+    rng = random.Random(0)
+    cities = zipf_weights(CITIES, skew)
+
+    db.session.execute(Venue.__table__.insert(), [{
+        'name': f'Venue {i}',
+        'city': f'City {city}',
+        'state': STATES[i % len(STATES)],
+        'address': f'{i} Main Street',
+        'phone': '555-555-5555',
+        'genres': rng.sample(GENRES, 2),
+        'seeking_talent': False,
+        'image_link': 'https://example.com/venue.png',
+    } for i, city in enumerate(rng.choices(range(CITIES), cum_weights=cities, k=venues))])
+    db.session.execute(Artist.__table__.insert(), [{
+        'name': f'Artist {i}',
+        'city': f'City {city}',
+        'state': STATES[i % len(STATES)],
+        'phone': '555-555-5555',
+        'genres': rng.sample(GENRES, 2),
+        'seeking_venue': False,
+        'image_link': 'https://example.com/artist.png',
+    } for i, city in enumerate(rng.choices(range(CITIES), cum_weights=cities, k=artists))])
+    db.session.commit()
+
+    venue_ids = [id for id, in db.session.query(Venue.id).order_by(Venue.id)]
+    artist_ids = [id for id, in db.session.query(Artist.id).order_by(Artist.id)]
+    venue_weights = zipf_weights(len(venue_ids), skew)
+    artist_weights = zipf_weights(len(artist_ids), skew)
+
+    # Shows are spread over two years either side of today
+    start = datetime.now(timezone.utc) - timedelta(days=730)
+    for offset in range(0, shows, batch_size):
+        count = min(batch_size, shows - offset)
+        rows = [{
+            'artist_id': artist_id,
+            'venue_id': venue_id,
+            'start_time': start + timedelta(minutes=rng.randrange(4 * 365 * 24 * 60)),
+        } for artist_id, venue_id in zip(rng.choices(artist_ids, cum_weights=artist_weights, k=count),
+                                         rng.choices(venue_ids, cum_weights=venue_weights, k=count))]
+        db.session.execute(insert(Show.__table__).on_conflict_do_nothing(), rows)
+        db.session.commit()
+
+    # Bring the upcoming show counters in line with the seeded shows
+    for model, key in ((Venue, Show.venue_id), (Artist, Show.artist_id)):
+        fix_drift(model, counter_drift(model, key))
+    db.session.commit()
+
+    return venue_ids, artist_ids
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Seed the database with synthetic data.')
+    parser.add_argument('--venues', type=int, default=2000)
+    parser.add_argument('--artists', type=int, default=5000)
+    parser.add_argument('--shows', type=int, default=1000000)
+    parser.add_argument('--skew', type=float, default=1.0, help='Zipf exponent of city sizes and venue/artist popularity; 0 is uniform.')
+    args = parser.parse_args()
+
+    with app.app_context():
+        seed(args.venues, args.artists, args.shows, skew=args.skew)
@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import app
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist
+from http_flows import HTTPClient, worker, summarize
+from seed import zipf_weights
+
+
+def dev_server(port):
+    # The Flask development server, threaded as `flask run` starts it, without the reloader
+    env = dict(os.environ, FLASK_APP='app.py', FYYUR_ENV='development')
+    return subprocess.Popen([sys.executable, '-m', 'flask', 'run', '--port', str(port), '--with-threads', '--no-reload'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def production_server(port, workers, threads):
+    env = dict(os.environ, FYYUR_ENV='production', GUNICORN_BIND=f'127.0.0.1:{port}',
+               WEB_CONCURRENCY=str(workers), GUNICORN_THREADS=str(threads))
+    env.setdefault('SECRET_KEY', 'benchmark')
+    return subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_up(url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url + '/'):
+                return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    raise RuntimeError(f'{url} did not start within {timeout} seconds')
+
+
+def run_load(url, ids, clients, duration):
+    # Throughput and latency percentiles over all requests of the http_flows user flows
+    timings, errors = defaultdict(list), list()
+    threads = [threading.Thread(target=worker, args=(HTTPClient(url), ids, duration, timings, errors, i))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    merged = [value for values in timings.values() for value in values]
+    return summarize({'all': merged}, ['all'] * len(errors), duration)['all']
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Replay the http_flows user flows against the development server and against gunicorn '
+                    '(gunicorn.conf.py) on this machine, and compare throughput and latency.')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent client threads.')
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() * 2 + 1)
+    parser.add_argument('--threads', type=int, default=4, help='Threads per gunicorn worker.')
+    parser.add_argument('--port', type=int, default=5100, help='The servers listen on this port and the next.')
+    args = parser.parse_args()
+
+    with app.app_context():
+        ids = {
+            'venues': [id for id, in db.session.query(Venue.id).order_by(Venue.id)],
+            'artists': [id for id, in db.session.query(Artist.id).order_by(Artist.id)],
+        }
+    ids['venues_weights'] = zipf_weights(len(ids['venues']), args.skew)
+    ids['artists_weights'] = zipf_weights(len(ids['artists']), args.skew)
+
+    servers = [
+        ('flask run', args.port, lambda: dev_server(args.port)),
+        (f'gunicorn {args.workers}x{args.threads}', args.port + 1,
+         lambda: production_server(args.port + 1, args.workers, args.threads)),
+    ]
+    results = dict()
+    for name, port, start in servers:
+        url = f'http://127.0.0.1:{port}'
+        process = start()
+        try:
+            wait_until_up(url)
+            results[name] = run_load(url, ids, args.clients, args.duration)
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f'{args.clients} clients, {args.duration:g} s each')
+    print(f"{'server':20} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in results.items():
+        print(f"{name:20} {row['requests']:9} {row['errors']:7} {row['throughput']:8.1f} "
+              f"{row['p50']:9.2f} {row['p95']:9.2f} {row['p99']:9.2f}")
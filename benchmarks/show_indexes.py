@@ -0,0 +1,80 @@
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from fyyur.extensions import db, cache
+from fyyur.models import Venue, Artist, Show
+from seed import seed
+
+SHOW_INDEXES = list(Show.__table__.indexes)
+
+
+def percentiles(timings):
+    timings = sorted(timings)
+    return {
+        'p50': statistics.median(timings),
+        'p99': timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+
+def measure(client, venue_ids, artist_ids, samples):
+    # Time each endpoint over the given number of requests, in milliseconds
+    rng = random.Random(1)
+    urls = {
+        'show_venue': lambda: f'/venues/{rng.choice(venue_ids)}',
+        'show_artist': lambda: f'/artists/{rng.choice(artist_ids)}',
+        'shows': lambda: '/shows',
+    }
+    results = dict()
+    for name, url in urls.items():
+        timings = list()
+        for _ in range(samples if name != 'shows' else max(1, samples // 20)):
+            # Run the queries every time, rather than serve pages or tiles cached by earlier requests
+            cache.clear()
+            app.jinja_env.fragment_cache.clear()
+            started = time.perf_counter()
+            client.get(url())
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = percentiles(timings)
+    return results
+
+
+def report(label, results):
+    print(label)
+    for name, result in results.items():
+        print(f"  {name:<12} p50 {result['p50']:9.2f} ms   p99 {result['p99']:9.2f} ms")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare Show lookups with and without the Show indexes.')
+    parser.add_argument('--shows', type=int, default=1000000)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--no-seed', action='store_true', help='reuse the data already in the database')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.no_seed:
+            venue_ids = [id for id, in db.session.query(Venue.id)]
+            artist_ids = [id for id, in db.session.query(Artist.id)]
+        else:
+            venue_ids, artist_ids = seed(shows=args.shows)
+        client = app.test_client()
+
+        for index in SHOW_INDEXES:
+            db.session.execute(f'DROP INDEX IF EXISTS {index.name}')
+        db.session.execute('ANALYZE show')
+        db.session.commit()
+        report('without indexes', measure(client, venue_ids, artist_ids, args.samples))
+
+        for index in SHOW_INDEXES:
+            index.create(db.engine)
+        db.session.execute('ANALYZE show')
+        db.session.commit()
+        report('with indexes', measure(client, venue_ids, artist_ids, args.samples))
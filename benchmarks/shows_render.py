@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import babel.dates
+import dateutil.parser
+from flask import current_app, render_template
+
+from app import app
+from fyyur.formatting import format_datetimes
+
+
+def legacy_format_datetime(value, format='medium'):
+    # The filter as it was when show times were passed around as 'YYYY-MM-DD HH:MM:SSZ' strings
+    date = dateutil.parser.parse(value)
+    if format == 'full':
+        format="EEEE MMMM, d, y 'at' h:mma"
+    elif format == 'medium':
+        format="EE MM, dd, y h:mma"
+    return babel.dates.format_datetime(date, format)
+
+
+def make_shows(count, legacy):
+    start = datetime.now(timezone.utc)
+    start_times = [start + timedelta(hours=i) for i in range(count)]
+    if legacy:
+        texts = [legacy_format_datetime(f'{start_time.replace(tzinfo=None)}Z', 'full') for start_time in start_times]
+    else:
+        texts = format_datetimes(start_times, 'full')
+
+    return [{
+        'venue_id': i,
+        'venue_name': f'Venue {i}',
+        'artist_id': i,
+        'artist_name': f'Artist {i}',
+        'artist_image_link': 'https://example.com/artist.png',
+        'start_time': start_times[i],
+        'start_time_text': texts[i],
+    } for i in range(count)]
+
+
+def time_render(count, legacy, repeat):
+    # Best of several builds and renders of the /shows page, in milliseconds; each render starts
+    # with no cached show tiles, so every show time is formatted and rendered
+    timings = list()
+    for _ in range(repeat):
+        current_app.jinja_env.fragment_cache.clear()
+        started = time.perf_counter()
+        render_template('pages/shows.html', shows=make_shows(count, legacy), next_url=None)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build and render /shows with parsed string timestamps versus batch-formatted datetimes.')
+    parser.add_argument('--shows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with app.test_request_context('/shows'):
+        legacy = time_render(args.shows, True, args.repeat)
+        current = time_render(args.shows, False, args.repeat)
+
+    print(f'{args.shows} shows')
+    print(f'  string timestamps  {legacy:9.2f} ms')
+    print(f'  batch formatted    {current:9.2f} ms')
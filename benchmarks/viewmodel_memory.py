@@ -0,0 +1,108 @@
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import g, render_template
+
+from app import app
+from fyyur.counters import record_new_shows
+from fyyur.extensions import db
+from fyyur.formatting import format_datetimes
+from fyyur.models import Venue, Artist, Show
+from fyyur.queries import venue_details, venue_shows
+from fyyur.viewmodels import venue_page
+
+
+def legacy_venue_page(venue_id):
+    # The venue page as it was built before the view models: full entity, one dict per show
+    venue = Venue.query.get(venue_id)
+    past_shows, upcoming_shows = venue_shows(venue_id, g.now)
+
+    def show_dicts(shows):
+        start_times = format_datetimes([show.start_time for show in shows], 'full')
+        return [{
+            'artist_id': show.artist_id,
+            'artist_name': show.artist_name,
+            'artist_image_link': show.artist_image_link,
+            'start_time': show.start_time,
+            'start_time_text': start_time_text,
+        } for show, start_time_text in zip(shows, start_times)]
+
+    return {
+        'id': venue.id,
+        'name': venue.name,
+        'genres': venue.genres,
+        'address': venue.address,
+        'city': venue.city,
+        'state': venue.state,
+        'phone': venue.phone,
+        'website': venue.website,
+        'facebook_link': venue.facebook_link,
+        'seeking_talent': venue.seeking_talent,
+        'seeking_description': venue.seeking_description,
+        'image_link': venue.image_link,
+        'past_shows': show_dicts(past_shows),
+        'upcoming_shows': show_dicts(upcoming_shows),
+        'past_shows_count': len(past_shows),
+        'upcoming_shows_count': len(upcoming_shows),
+    }
+
+
+def current_venue_page(venue_id):
+    past_shows, upcoming_shows = venue_shows(venue_id, g.now)
+    return venue_page(venue_details(venue_id), past_shows, upcoming_shows)
+
+
+def seed_venue(shows):
+    # One venue with the given number of shows, half of them upcoming, by a single artist
+    venue = Venue(name='Benchmark Venue', city='City 0', state='CA', address='1 Main Street', phone='555-555-5555',
+                  genres=['Jazz'], image_link='https://example.com/venue.png')
+    artist = Artist(name='Benchmark Artist', city='City 0', state='CA', phone='555-555-5555',
+                    genres=['Jazz'], image_link='https://example.com/artist.png')
+    db.session.add_all([venue, artist])
+    db.session.flush()
+
+    start = datetime.now(timezone.utc) - timedelta(hours=shows // 2)
+    rows = [{'artist_id': artist.id, 'venue_id': venue.id, 'start_time': start + timedelta(hours=i)} for i in range(shows)]
+    db.session.execute(Show.__table__.insert(), rows)
+    record_new_shows([(row['artist_id'], row['venue_id'], row['start_time']) for row in rows])
+    db.session.commit()
+    return venue.id
+
+
+def measure(build, venue_id):
+    # Memory held by the page data, and peak memory while building and rendering it, in bytes
+    db.session.expunge_all()
+    tracemalloc.start()
+    data = build(venue_id)
+    retained, _ = tracemalloc.get_traced_memory()
+    render_template('pages/show_venue.html', venue=data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, peak
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Memory of a venue page built from per-row dicts versus slotted view models.')
+    parser.add_argument('--shows', type=int, default=10000)
+    parser.add_argument('--venue-id', type=int, help='measure an existing venue instead of seeding one')
+    args = parser.parse_args()
+
+    with app.test_request_context():
+        g.now = datetime.now(timezone.utc)
+        venue_id = args.venue_id or seed_venue(args.shows)
+
+        # Warm up caches (compiled queries, templates, Babel patterns) outside the measurements
+        measure(current_venue_page, venue_id)
+        legacy = measure(legacy_venue_page, venue_id)
+        current = measure(current_venue_page, venue_id)
+
+    print(f'venue {venue_id}')
+    print(f'  {"":12} {"retained MiB":>14} {"peak MiB":>10}')
+    print(f'  {"dicts":12} {legacy[0] / 2 ** 20:14.2f} {legacy[1] / 2 ** 20:10.2f}')
+    print(f'  {"view models":12} {current[0] / 2 ** 20:14.2f} {current[1] / 2 ** 20:10.2f}')
@@ -6,9 +6,7 @@ from fabric.contrib.console import confirm
 
 def test():
     with settings(warn_only=True):
-        result = local(
-            "python test_tasks.py -v && python test_users.py -v", capture=True
-        )
+        result = local("python -m pytest", capture=True)
     if result.failed and not confirm("Tests failed. Continue?"):
         abort("Aborted at user request.")
 
@@ -39,9 +37,7 @@ def heroku():
 
 
 def heroku_test():
-    local(
-        "heroku run python test_tasks.py -v && heroku run python test_users.py -v"
-    )
+    local("heroku run python -m pytest")
 
 
 def deploy():
@@ -51,6 +47,28 @@ def deploy():
     heroku()
     heroku_test()
 
+# benchmarks
+
+
+def bench(baseline='benchmarks/baseline.json'):
+    local("python benchmarks/http_flows.py --output benchmarks/results.json --baseline {}".format(baseline))
+
+
+def bench_baseline():
+    local("python benchmarks/http_flows.py --output benchmarks/baseline.json")
+
+
+def bench_serving():
+    local("python benchmarks/serving.py")
+
+
+def bench_startup():
+    local("python benchmarks/import_time.py")
+
+
+def bench_reads():
+    local("python benchmarks/read_concurrency.py")
+
 # rollback
 
 
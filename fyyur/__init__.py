@@ -0,0 +1,80 @@
+import logging
+import os
+import secrets
+from logging import Formatter, FileHandler
+
+from flask import Flask
+
+from . import config
+from .extensions import db, cache
+
+
+def create_app(config_class=None, migrations=True):
+    # The Fyyur app configured by config_class, by default the one named by FYYUR_ENV. The
+    # blueprints, models and their dependencies are imported here, not when the package is.
+    # Without migrations, `flask db` is unavailable and Flask-Migrate (with Alembic, Mako and
+    # Pygments) is not imported; the production workers do without it.
+    app = Flask(__name__, instance_relative_config=True)
+    app.config.from_object(config_class or config.from_env())
+    configure_secret_key(app)
+
+    from .assets import Assets
+    from .cache import make_cache
+    from .commands import COMMANDS
+    from .fragments import FragmentCacheExtension
+    from .httpcache import HTTPCacheMiddleware
+    from .pool import MeteredQueuePool
+    from .profiling import RequestProfiler
+
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(app.config['SQLALCHEMY_ENGINE_OPTIONS'])
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].setdefault('poolclass', MeteredQueuePool)
+    db.init_app(app)
+    if migrations:
+        from flask_migrate import Migrate
+        Migrate(app, db)
+    cache.init_app(app)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    app.jinja_env.fragment_cache = make_cache(app.config, 'FRAGMENT_CACHE_')
+    Assets(app)
+    app.wsgi_app = HTTPCacheMiddleware(app.wsgi_app, app.config['COMPRESS_MIN_SIZE'], app.config['COMPRESS_LEVEL'])
+    RequestProfiler(app)
+
+    from .api import api
+    from .artists import artists_bp
+    from .main import main_bp
+    from .shows import shows_bp
+    from .venues import venues_bp
+
+    for blueprint in (main_bp, venues_bp, artists_bp, shows_bp, api):
+        app.register_blueprint(blueprint)
+    for command in COMMANDS:
+        app.cli.add_command(command)
+
+    if not app.debug and not app.testing:
+        file_handler = FileHandler('error.log')
+        file_handler.setFormatter(
+            Formatter('%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]')
+        )
+        app.logger.setLevel(logging.INFO)
+        file_handler.setLevel(logging.INFO)
+        app.logger.addHandler(file_handler)
+        app.logger.info('errors')
+
+    return app
+
+
+def configure_secret_key(app):
+    # Sessions and CSRF tokens are signed with SECRET_KEY, so it must survive restarts and be the
+    # same in every worker. Outside production a key is generated once into the instance folder.
+    if app.config['SECRET_KEY']:
+        return
+    if not app.config['DEBUG']:
+        raise RuntimeError('SECRET_KEY must be set in production')
+
+    path = os.path.join(app.instance_path, 'secret_key')
+    if not os.path.exists(path):
+        os.makedirs(app.instance_path, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(secrets.token_hex(32))
+    with open(path) as f:
+        app.config['SECRET_KEY'] = f.read().strip()
@@ -0,0 +1,146 @@
+import hashlib
+import json
+from datetime import date
+
+from flask import Blueprint, Response, abort, current_app, g, request
+
+from .artists import artist_page_data
+from .models import Venue, Artist
+from .queries import listing, search, show_page
+from .shows import show_filters
+from .tours import book_tour
+from .venues import venue_page_data
+from .viewmodels import SHOW_API_FIELDS, as_dict, summaries
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+
+def json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def dumps(data):
+    # orjson when installed, the standard library otherwise
+    if orjson is not None:
+        return orjson.dumps(data, default=json_default)
+    return json.dumps(data, default=json_default, separators=(',', ':')).encode()
+
+
+def select_fields(item):
+    # Keep only the top-level fields listed in ?fields=a,b,c
+    fields = request.args.get('fields')
+    if not fields:
+        return item
+    fields = fields.split(',')
+    return {key: value for key, value in item.items() if key in fields}
+
+
+def json_response(data):
+    # Strong ETag over the serialized body; unchanged resources are answered with 304
+    body = dumps(data)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(hashlib.sha1(body).hexdigest())
+    return response.make_conditional(request)
+
+
+def page_args():
+    per_page = min(request.args.get('per_page', current_app.config['API_PER_PAGE'], type=int), current_app.config['API_MAX_PER_PAGE'])
+    page = max(request.args.get('page', 1, type=int), 1)
+    return page, max(per_page, 1)
+
+
+def list_entities(model):
+    page, per_page = page_args()
+    rows = listing(model, per_page, (page - 1) * per_page)
+    return json_response({
+        'data': [select_fields(row._asdict()) for row in rows],
+        'page': page,
+        'per_page': per_page,
+    })
+
+
+def search_entities(model):
+    page, per_page = page_args()
+    total, rows = search(model, request.args.get('q', ''), per_page, (page - 1) * per_page)
+    return json_response({
+        'count': total,
+        'data': [select_fields(as_dict(summary)) for summary in summaries(rows)],
+        'page': page,
+        'per_page': per_page,
+    })
+
+
+@api.errorhandler(400)
+@api.errorhandler(404)
+def error(error):
+    return Response(dumps({'error': error.description}), status=error.code, mimetype='application/json')
+
+
+@api.route('/venues')
+def venues():
+    return list_entities(Venue)
+
+
+@api.route('/venues/search')
+def search_venues():
+    return search_entities(Venue)
+
+
+@api.route('/venues/<int:venue_id>')
+def venue(venue_id):
+    return json_response(select_fields(as_dict(venue_page_data(venue_id))))
+
+
+@api.route('/artists')
+def artists():
+    return list_entities(Artist)
+
+
+@api.route('/artists/search')
+def search_artists():
+    return search_entities(Artist)
+
+
+@api.route('/artists/<int:artist_id>')
+def artist(artist_id):
+    return json_response(select_fields(as_dict(artist_page_data(artist_id))))
+
+
+@api.route('/shows')
+def shows():
+    try:
+        rows, next_cursor = show_page(
+            g.now,
+            page_args()[1],
+            cursor=request.args.get('cursor'),
+            **show_filters(request.args)
+        )
+    except ValueError:
+        abort(400)
+
+    return json_response({
+        'data': [select_fields({field: getattr(row, field) for field in SHOW_API_FIELDS}) for row in rows],
+        'next_cursor': next_cursor,
+    })
+
+
+@api.route('/tours', methods=['POST'])
+def create_tour():
+    # Book an artist for a list of (venue_id, start_time) dates or an RRULE residency, all or nothing
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+
+    result = book_tour(data, current_app.config['TOUR_MAX_SHOWS'])
+    if result.errors:
+        body = {'errors': [{'index': index, 'errors': errors} for index, errors in result.errors]}
+        return Response(dumps(body), status=422, mimetype='application/json')
+
+    return Response(dumps({'inserted': result.inserted}), status=201, mimetype='application/json')
@@ -0,0 +1,176 @@
+import sys
+
+from flask import Blueprint, current_app, render_template, request, flash, redirect, url_for, abort, g
+
+from .cache import venue_key, artist_key, page_timeout
+from .extensions import db, cache
+from .httpcache import cache_policy
+from .models import Artist, Show
+from .queries import search, listing_version, artist_details, artist_shows
+from .viewmodels import summaries, artist_page, Tile
+
+artists_bp = Blueprint('artists', __name__)
+
+
+def artist_cache_keys(artist_id):
+    # An artist is shown on its own page and on the pages of the venues it plays at
+    venue_ids = db.session.query(Show.venue_id).filter(Show.artist_id == artist_id).distinct()
+    return [artist_key(artist_id)] + [venue_key(venue_id) for venue_id, in venue_ids]
+
+
+@artists_bp.route('/artists')
+@cache_policy(private=True, no_cache=True, etag=lambda: listing_version(Artist))
+def artists():
+    artists = db.session.query(Artist.id, Artist.name, Artist.upcoming_shows_count, Artist.version).all()
+    data = [Tile(*artist) for artist in artists]
+    return render_template('pages/artists.html', artists=data)
+
+@artists_bp.route('/artists/search', methods=['POST'])
+def search_artists():
+    # search on artists with partial string search. Ensure it is case-insensitive.
+    search_term = request.form.get('search_term', '')
+    limit = request.form.get('limit', current_app.config['SEARCH_RESULTS_PER_PAGE'], type=int)
+    offset = request.form.get('offset', 0, type=int)
+    total, artists = search(Artist, search_term, limit, offset)
+
+    response={
+        "count": total,
+        "data": summaries(artists),
+        "limit": limit,
+        "offset": offset,
+    }
+
+    return render_template('pages/search_artists.html', results=response, search_term=request.form.get('search_term', ''))
+
+@artists_bp.route('/artists/<int:artist_id>')
+@cache_policy(private=True, no_cache=True)
+def show_artist(artist_id):
+    # shows the artist page with the given artist_id
+    data = artist_page_data(artist_id)
+
+    return render_template('pages/show_artist.html', artist=data)
+
+def artist_page_data(artist_id):
+    # Artist page view model, cached until its next show starts
+    data = cache.get(artist_key(artist_id))
+    if data is not None:
+        return data
+
+    # Read from the primary: the entry is shared with every client, and a page read from a
+    # lagging replica just after an edit would stay cached until it expires
+    now = g.now
+    with db.on_primary():
+        artist = artist_details(artist_id)
+        if artist is None:
+            abort(404)
+
+        # Get past and upcoming shows
+        past_shows, upcoming_shows = artist_shows(artist_id, now)
+
+    data = artist_page(artist, past_shows, upcoming_shows)
+    cache.set(artist_key(artist_id), data, page_timeout(upcoming_shows, now, current_app.config['CACHE_DEFAULT_TIMEOUT']))
+
+    return data
+
+#  Update
+#  ----------------------------------------------------------------
+@artists_bp.route('/artists/<int:artist_id>/edit', methods=['GET'])
+def edit_artist(artist_id):
+    from .forms import ArtistForm  # WTForms (and Babel, via Flask-WTF) load on first use
+
+    artist = Artist.query.get(artist_id)
+    if artist:
+        form = ArtistForm(obj=artist)
+    else:
+        form = ArtistForm()
+    return render_template('forms/edit_artist.html', form=form, artist=artist)
+
+@artists_bp.route('/artists/<int:artist_id>/edit', methods=['POST'])
+def edit_artist_submission(artist_id):
+    error = False
+    artist = Artist.query.get(artist_id)
+
+    try:
+        parsed_form = {
+            'name': request.form.get('name'),
+            'city': request.form.get('city'),
+            'state': request.form.get('state'),
+            'phone': request.form.get('phone'),
+            'image_link': request.form.get('image_link'),
+            'facebook_link': request.form.get('facebook_link'),
+            'genres': request.form.getlist('genres'),
+            'seeking_description': request.form.get('seeking_description'),
+            'seeking_venue': True if request.form.get('seeking_venue') else False,
+            'website': request.form.get('website'),
+        }
+        artist.name = parsed_form.get('name')
+        artist.city = parsed_form.get('city')
+        artist.state = parsed_form.get('state')
+        artist.phone = parsed_form.get('phone')
+        artist.image_link = parsed_form.get('image_link')
+        artist.facebook_link = parsed_form.get('facebook_link')
+        artist.genres = parsed_form.get('genres')
+        artist.seeking_description = parsed_form.get('seeking_description')
+        artist.seeking_venue = parsed_form.get('seeking_venue')
+        artist.website = parsed_form.get('website')
+        db.session.commit()
+        cache.delete(*artist_cache_keys(artist_id))
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful db insert, flash error
+        flash(f"Oops! Artist {request.form['name']} could not be updated.")
+    else:
+        # on successful db insert, flash success
+        flash(f"Artist {request.form['name']} was successfully updated!")
+
+    return redirect(url_for('artists.show_artist', artist_id=artist_id))
+
+#  Create Artist
+#  ----------------------------------------------------------------
+
+@artists_bp.route('/artists/create', methods=['GET'])
+def create_artist_form():
+    from .forms import ArtistForm
+
+    form = ArtistForm()
+    return render_template('forms/new_artist.html', form=form)
+
+@artists_bp.route('/artists/create', methods=['POST'])
+def create_artist_submission():
+    error = False
+
+    try:
+        parsed_form = {
+            'name': request.form.get('name'),
+            'city': request.form.get('city'),
+            'state': request.form.get('state'),
+            'phone': request.form.get('phone'),
+            'image_link': request.form.get('image_link'),
+            'facebook_link': request.form.get('facebook_link'),
+            'genres': request.form.getlist('genres'),
+            'seeking_description': request.form.get('seeking_description'),
+            'seeking_venue': True if request.form.get('seeking_venue') else False,
+            'website': request.form.get('website'),
+        }
+        artist = Artist(**parsed_form)
+        db.session.add(artist)
+        db.session.commit()
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful db insert, flash error
+        flash(f"Oops! Artist {request.form['name']} could not be listed.")
+    else:
+        # on successful db insert, flash success
+        flash(f"Artist {request.form['name']} was successfully listed!")
+
+    return render_template('pages/home.html')
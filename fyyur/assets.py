@@ -0,0 +1,234 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+
+from flask import request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Bundles written to static/dist, and the files under static/ they are made of, in load order
+BUNDLES = {
+    'bundle.css': [
+        'css/bootstrap.min.css',
+        'css/layout.main.css',
+        'css/main.css',
+        'css/main.responsive.css',
+        'css/main.quickfix.css',
+    ],
+    # Loaded synchronously in <head>
+    'head.js': [
+        'js/libs/modernizr-2.8.2.min.js',
+        'js/libs/moment.min.js',
+    ],
+    # Deferred; jQuery first, as the other scripts use it
+    'bundle.js': [
+        'js/libs/jquery-1.11.1.min.js',
+        'js/script.js',
+        'js/libs/bootstrap-3.1.1.min.js',
+        'js/plugins.js',
+    ],
+}
+
+# Other files copied to static/dist under a content-hashed name
+FINGERPRINTED = ['img']
+
+# Pre-compressed copies are written for these types only; images are already compressed
+COMPRESSIBLE = ('.css', '.js', '.svg')
+
+# Fingerprinted files never change under the same name
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+SOURCE_MAP = re.compile(r'^\s*//[#@] sourceMappingURL=.*$', re.MULTILINE)
+
+
+def minify_css(text):
+    if rcssmin is not None:
+        return rcssmin.cssmin(text)
+    # Drop comments and collapse whitespace; safe for the stylesheets under static/css
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'\s+', ' ', text)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', text).replace(';}', '}').strip()
+
+
+def minify_js(text):
+    # Without rjsmin the scripts are only concatenated; most of them are already minified
+    text = SOURCE_MAP.sub('', text)
+    return rjsmin.jsmin(text) if rjsmin is not None else text
+
+
+def fingerprint(name, content):
+    root, ext = os.path.splitext(name)
+    return f'{root}.{hashlib.sha1(content).hexdigest()[:12]}{ext}'
+
+
+def write_file(path, content):
+    # Write to a temporary file renamed into place, so that no process ever reads (or sends, with
+    # a year-long immutable Cache-Control) a partly written file
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def write_asset(dist, name, content):
+    path = os.path.join(dist, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_file(path, content)
+    if name.endswith(COMPRESSIBLE):
+        write_file(path + '.gz', gzip.compress(content, 9, mtime=0))
+        if brotli is not None:
+            write_file(path + '.br', brotli.compress(content))
+
+
+def build(static_folder):
+    # Bundle, minify, fingerprint and pre-compress the assets; returns the manifest of
+    # logical names to fingerprinted paths under static/dist
+    dist = os.path.join(static_folder, 'dist')
+    manifest = dict()
+
+    for bundle, files in BUNDLES.items():
+        texts = list()
+        for source in files:
+            with open(os.path.join(static_folder, source), encoding='utf-8') as f:
+                texts.append(f.read())
+        if bundle.endswith('.css'):
+            content = '\n'.join(minify_css(text) for text in texts)
+        else:
+            content = ';\n'.join(minify_js(text) for text in texts)
+        content = content.encode('utf-8')
+        manifest[bundle] = fingerprint(bundle, content)
+        write_asset(dist, manifest[bundle], content)
+
+    for name, path in fingerprinted_files(static_folder):
+        with open(path, 'rb') as f:
+            content = f.read()
+        manifest[name] = fingerprint(name, content)
+        write_asset(dist, manifest[name], content)
+
+    # Written last, once every file it names is in place. Older fingerprinted files are kept for
+    # pages rendered before the build.
+    write_file(os.path.join(dist, 'manifest.json'), json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+
+def load_manifest(static_folder):
+    path = os.path.join(static_folder, 'dist', 'manifest.json')
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise RuntimeError(f'{path} is missing; build the assets with `flask assets build`') from None
+
+
+def stale(static_folder):
+    # Whether the manifest is missing or older than one of the sources
+    path = os.path.join(static_folder, 'dist', 'manifest.json')
+    if not os.path.exists(path):
+        return True
+    built = os.path.getmtime(path)
+    return any(os.path.getmtime(source) > built for source in source_files(static_folder))
+
+
+def build_if_stale(static_folder):
+    # Run once before serving (gunicorn.conf.py's when_ready), ahead of the workers
+    if stale(static_folder):
+        return build(static_folder)
+    return load_manifest(static_folder)
+
+
+def fingerprinted_files(static_folder):
+    # (name under static/, path) of the files of the FINGERPRINTED directories
+    for directory in FINGERPRINTED:
+        for root, _, files in os.walk(os.path.join(static_folder, directory)):
+            for file in files:
+                if not file.startswith('.'):
+                    path = os.path.join(root, file)
+                    yield os.path.relpath(path, static_folder).replace(os.sep, '/'), path
+
+
+def source_files(static_folder):
+    for files in BUNDLES.values():
+        for file in files:
+            yield os.path.join(static_folder, file)
+    for _, path in fingerprinted_files(static_folder):
+        yield path
+
+
+class Assets:
+    # Serves the fingerprinted bundles from /static/dist with far-future caching and resolves
+    # logical names to them in templates with static_url(). They are built ahead of time, by
+    # `flask assets build` or when gunicorn starts; only in debug mode are they (re)built on use,
+    # when a source changed.
+
+    def __init__(self, app):
+        self.app = app
+        self.static_folder = app.static_folder
+        self.dist = os.path.join(app.static_folder, 'dist')
+        self._manifest = None
+        self._lock = threading.Lock()
+
+        app.extensions['assets'] = self
+        app.add_template_global(self.static_url, 'static_url')
+        app.add_url_rule('/static/dist/<path:filename>', 'dist', self.send)
+
+    def manifest(self):
+        if self._manifest is not None and not self.app.debug:
+            return self._manifest
+        with self._lock:
+            if self.app.debug and stale(self.static_folder):
+                self._manifest = build(self.static_folder)
+            elif self._manifest is None:
+                self._manifest = load_manifest(self.static_folder)
+            return self._manifest
+
+    def build(self):
+        with self._lock:
+            self._manifest = build(self.static_folder)
+            return self._manifest
+
+    def static_url(self, name):
+        # URL of the fingerprinted copy of a bundle or file, or of the file itself
+        fingerprinted = self.manifest().get(name)
+        if fingerprinted is None:
+            return url_for('static', filename=name)
+        return url_for('dist', filename=fingerprinted)
+
+    def send(self, filename):
+        # Send the smallest pre-compressed copy the client accepts
+        mimetype = mimetypes.guess_type(filename)[0]
+        encoding = None
+        for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if request.accept_encodings[candidate] and os.path.isfile(os.path.join(self.dist, filename + suffix)):
+                encoding = candidate
+                filename += suffix
+                break
+
+        response = send_from_directory(self.dist, filename, mimetype=mimetype, conditional=True, cache_timeout=31536000)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = IMMUTABLE
+        return response
@@ -0,0 +1,126 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+
+class SimpleCache:
+    # In-process LRU cache whose entries also expire after a timeout in seconds
+
+    def __init__(self, threshold=1000, default_timeout=300):
+        self.threshold = threshold
+        self.default_timeout = default_timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        timeout = self.default_timeout if timeout is None else timeout
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries
+            while len(self._entries) > self.threshold:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache:
+    # Cache shared between processes, backed by any Redis-compatible client
+
+    def __init__(self, client, default_timeout=300, key_prefix='fyyur:'):
+        self.client = client
+        self.default_timeout = default_timeout
+        self.key_prefix = key_prefix
+
+    def get(self, key):
+        value = self.client.get(self.key_prefix + key)
+        return None if value is None else pickle.loads(value)
+
+    def set(self, key, value, timeout=None):
+        timeout = self.default_timeout if timeout is None else timeout
+        # Redis rejects expiry times below a millisecond
+        self.client.set(self.key_prefix + key, pickle.dumps(value), px=max(1, int(timeout * 1000)))
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*[self.key_prefix + key for key in keys])
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.key_prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+def make_cache(config, prefix='CACHE_'):
+    # Build the cache configured by CACHE_TYPE ('simple' or 'redis'), or by the settings
+    # under another prefix (e.g. FRAGMENT_CACHE_TYPE)
+    if config[prefix + 'TYPE'] == 'redis':
+        import redis
+        client = redis.Redis.from_url(config['CACHE_REDIS_URL'])
+        return RedisCache(client, config[prefix + 'DEFAULT_TIMEOUT'])
+
+    return SimpleCache(config[prefix + 'THRESHOLD'], config[prefix + 'DEFAULT_TIMEOUT'])
+
+
+class Cache:
+    # The cache configured by init_app for the current app (see make_cache); importable before
+    # any app exists
+
+    def __init__(self, prefix='CACHE_'):
+        self.prefix = prefix
+
+    def init_app(self, app):
+        app.extensions.setdefault('cache', dict())[self.prefix] = make_cache(app.config, self.prefix)
+
+    @property
+    def backend(self):
+        return current_app.extensions['cache'][self.prefix]
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def set(self, key, value, timeout=None):
+        self.backend.set(key, value, timeout)
+
+    def delete(self, *keys):
+        self.backend.delete(*keys)
+
+    def clear(self):
+        self.backend.clear()
+
+
+def venue_key(venue_id):
+    return f'venue:{venue_id}'
+
+
+def artist_key(artist_id):
+    return f'artist:{artist_id}'
+
+
+def page_timeout(upcoming_shows, now, default_timeout):
+    # Expire a detail page when its next upcoming show moves into the past
+    if not upcoming_shows:
+        return default_timeout
+    return min(default_timeout, (upcoming_shows[0].start_time - now).total_seconds())
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .counters import sync_counters, counter_drift, fix_drift
+from .exporter import generate_export
+from .extensions import db
+from .importer import import_stream
+from .models import Venue, Artist, Show
+
+#  Import
+#  ----------------------------------------------------------------
+
+@click.command('import')
+@click.argument('entity', type=click.Choice(['venues', 'artists', 'shows']))
+@click.argument('file', type=click.File('r', encoding='utf-8'))
+@click.option('--format', type=click.Choice(['csv', 'ndjson']), help='Defaults to csv for .csv files, ndjson otherwise.')
+@click.option('--chunk-size', type=int, help='Rows per transaction.')
+@with_appcontext
+def import_command(entity, file, format, chunk_size):
+    """Bulk import venues, artists or shows from a CSV or NDJSON file."""
+    format = format or ('csv' if file.name.endswith('.csv') else 'ndjson')
+    result = import_stream(entity, file, format, chunk_size or current_app.config['IMPORT_CHUNK_SIZE'])
+
+    for line, errors in result.errors:
+        click.echo(f'line {line}: {errors}', err=True)
+    click.echo(f'{result.inserted} rows imported, {len(result.errors)} rows rejected.')
+
+#  Export
+#  ----------------------------------------------------------------
+
+@click.command('export')
+@click.argument('entity', type=click.Choice(['venues', 'artists', 'shows']))
+@click.option('--format', type=click.Choice(['csv', 'ndjson']), default='ndjson')
+@click.option('--output', type=click.File('w', encoding='utf-8'), default='-', help='Defaults to stdout.')
+@with_appcontext
+def export_command(entity, format, output):
+    """Export all venues, artists or shows as CSV or NDJSON."""
+    for chunk in generate_export(entity, format, current_app.config['EXPORT_BATCH_SIZE']):
+        output.write(chunk)
+
+#  Static assets
+#  ----------------------------------------------------------------
+
+@click.group('assets')
+def assets_command():
+    """Build the static asset bundles."""
+
+@assets_command.command('build')
+@with_appcontext
+def build_assets():
+    """Bundle, minify, fingerprint and compress the CSS and JS under static/."""
+    manifest = current_app.extensions['assets'].build()
+    for name, path in sorted(manifest.items()):
+        click.echo(f'{name} -> dist/{path}')
+
+#  Upcoming show counters
+#  ----------------------------------------------------------------
+
+@click.group()
+def counters():
+    """Maintain the upcoming show counters of venues and artists."""
+
+@counters.command('sync')
+@with_appcontext
+def sync_counters_command():
+    """Decrement the counters of shows that started since the last sync. Run periodically."""
+    started = sync_counters(datetime.now(timezone.utc))
+    click.echo(f'{started} shows moved into the past.')
+
+@counters.command('check')
+@click.option('--fix', is_flag=True, help='Overwrite drifted counters with the recomputed values.')
+@with_appcontext
+def check_counters_command(fix):
+    """Recompute the counters from the shows table and report drift."""
+    drifted = 0
+    for model, key in ((Venue, Show.venue_id), (Artist, Show.artist_id)):
+        drift = counter_drift(model, key)
+        for id, stored, actual in drift:
+            click.echo(f'{model.__tablename__} {id}: stored {stored}, actual {actual}')
+        if fix:
+            fix_drift(model, drift)
+        drifted += len(drift)
+    db.session.commit()
+    click.echo(f'{drifted} counters drifted' + (', fixed.' if fix and drifted else '.'))
+
+
+COMMANDS = [import_command, export_command, assets_command, counters]
@@ -0,0 +1,113 @@
+import os
+# Grabs the folder where the script runs.
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+
+class Config:
+    # Settings shared by every environment; FYYUR_ENV picks one of the subclasses below
+
+    # Must be set in production; development falls back to a key kept in instance/secret_key
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    DEBUG = False
+
+    # Connect to the database
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'postgresql://postgres@localhost:5432/fyyur')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Read replicas (comma separated URLs) used by GET requests; a client's reads stay on the
+    # primary for REPLICA_STICKY_SECONDS after each of its writes so it sees its own changes
+    SQLALCHEMY_REPLICA_URIS = [uri for uri in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if uri]
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 10))
+
+    # Number of results shown per page of venue and artist search
+    SEARCH_RESULTS_PER_PAGE = 25
+
+    # Number of shows shown per page of /shows
+    SHOWS_PER_PAGE = 60
+
+    # Cache for venue and artist pages: 'simple' (in-process LRU) or 'redis'
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'simple')
+    CACHE_REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_DEFAULT_TIMEOUT = 300
+    CACHE_THRESHOLD = 1000
+
+    # Cache for rendered listing tiles ({% cache %} in the templates). Their keys carry the row
+    # version, so entries are replaced on edit rather than evicted; size it for every tile.
+    FRAGMENT_CACHE_TYPE = 'simple'
+    FRAGMENT_CACHE_DEFAULT_TIMEOUT = 86400
+    FRAGMENT_CACHE_THRESHOLD = 20000
+
+    # Number of rows validated and inserted per transaction by bulk imports
+    IMPORT_CHUNK_SIZE = 1000
+
+    # Connection pool and per-statement timeout, overridable from the environment
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 5000))
+
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            # Let psycopg2 send executemany() inserts as multi-row VALUES statements
+            'executemany_mode': 'values',
+            'connect_args': {'options': f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}'},
+        })
+
+    # Queries taking at least this long are logged with their parameters
+    SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS', 200))
+
+    # Responses of at least COMPRESS_MIN_SIZE bytes are compressed at this gzip/brotli level
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+
+    # Number of rows fetched per round trip by the streaming exports
+    EXPORT_BATCH_SIZE = 1000
+
+    # Default and maximum page sizes of the JSON API
+    API_PER_PAGE = 50
+    API_MAX_PER_PAGE = 500
+
+    # Maximum number of shows booked by a single tour or residency
+    TOUR_MAX_SHOWS = 500
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+
+
+class ProductionConfig(Config):
+    # Served by gunicorn (see wsgi.py and gunicorn.conf.py). Each worker process has its own
+    # in-process caches, so set CACHE_TYPE=redis to share the page cache and its invalidation.
+    DEBUG = False
+
+
+class TestingConfig(Config):
+    # Used by the pytest suite (tests/), which migrates this database up and back down
+    TESTING = True
+    SECRET_KEY = 'testing'
+    WTF_CSRF_ENABLED = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'postgresql://postgres@localhost:5432/fyyur_test')
+
+
+CONFIGS = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+}
+
+
+def from_env(default='development'):
+    # The configuration class named by the FYYUR_ENV environment variable
+    name = os.environ.get('FYYUR_ENV', default)
+    if name not in CONFIGS:
+        raise ValueError(f"FYYUR_ENV must be one of {', '.join(CONFIGS)}, not {name!r}")
+    return CONFIGS[name]
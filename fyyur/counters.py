@@ -0,0 +1,72 @@
+from collections import Counter, defaultdict
+
+from .extensions import db
+from .models import Venue, Artist, Show, CounterSync
+
+# The upcoming_shows_count columns count the shows starting after CounterSync.synced_at.
+# Writes keep them current incrementally; sync_counters() moves synced_at forward and
+# decrements the counts of the shows that started in between.
+
+
+def synced_at():
+    # Share-lock the sync row so counters are never adjusted while a sync is moving it
+    return db.session.query(CounterSync).with_for_update(read=True).one().synced_at
+
+
+def adjust_counts(model, ids, sign=1):
+    # Add sign * occurrences of each id to its counter, with one UPDATE per distinct amount
+    by_amount = defaultdict(list)
+    for id, amount in Counter(ids).items():
+        by_amount[amount * sign].append(id)
+
+    for amount, ids in by_amount.items():
+        db.session.query(model).filter(model.id.in_(ids)) \
+            .update({model.upcoming_shows_count: model.upcoming_shows_count + amount}, synchronize_session=False)
+
+
+def record_new_shows(shows):
+    # Count new (artist_id, venue_id, start_time) shows; call within the inserting transaction
+    since = synced_at()
+    upcoming = [show for show in shows if show[2] > since]
+    adjust_counts(Venue, [venue_id for _, venue_id, _ in upcoming])
+    adjust_counts(Artist, [artist_id for artist_id, _, _ in upcoming])
+
+
+def forget_venue_shows(venue_id):
+    # Uncount a venue's upcoming shows from its artists before the venue is deleted
+    since = synced_at()
+    artist_ids = db.session.query(Show.artist_id).filter(Show.venue_id == venue_id, Show.start_time > since)
+    adjust_counts(Artist, [artist_id for artist_id, in artist_ids], -1)
+
+
+def sync_counters(now):
+    # Decrement the counters for every show that started since the last sync
+    state = db.session.query(CounterSync).with_for_update().one()
+    started = db.session.query(Show.artist_id, Show.venue_id) \
+        .filter(Show.start_time > state.synced_at, Show.start_time <= now).all()
+
+    adjust_counts(Venue, [venue_id for _, venue_id in started], -1)
+    adjust_counts(Artist, [artist_id for artist_id, _ in started], -1)
+    state.synced_at = now
+    db.session.commit()
+
+    return len(started)
+
+
+def counter_drift(model, key):
+    # (id, stored, actual) for every venue or artist whose counter disagrees with the shows table
+    since = synced_at()
+    actual = db.session.query(key.label('id'), db.func.count('*').label('count')) \
+        .filter(Show.start_time > since).group_by(key).subquery()
+    actual_count = db.func.coalesce(actual.c.count, 0)
+
+    return db.session.query(model.id, model.upcoming_shows_count, actual_count) \
+        .outerjoin(actual, actual.c.id == model.id) \
+        .filter(model.upcoming_shows_count != actual_count) \
+        .order_by(model.id).all()
+
+
+def fix_drift(model, drift):
+    for id, stored, actual in drift:
+        db.session.query(model).filter(model.id == id) \
+            .update({model.upcoming_shows_count: actual}, synchronize_session=False)
@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from .extensions import db
+from .models import Venue, Artist, Show
+
+MODELS = {
+    'venues': Venue,
+    'artists': Artist,
+    'shows': Show,
+}
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def columns(entity):
+    return [column.name for column in MODELS[entity].__table__.columns]
+
+
+def export_rows(entity, batch_size=1000):
+    # Stream every row of the entity through a server-side cursor, batch_size rows at a time
+    model = MODELS[entity]
+    table = model.__table__
+    return db.session.query(*table.columns) \
+        .order_by(*table.primary_key.columns) \
+        .execution_options(stream_results=True) \
+        .yield_per(batch_size)
+
+
+def export_value(value, format):
+    # Same representations the importer reads back: UTC show times, and ';' separated genres in CSV
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    if format == 'csv' and isinstance(value, list):
+        return ';'.join(value)
+    if format == 'csv' and isinstance(value, bool):
+        return 'y' if value else ''
+    return value
+
+
+def generate_ndjson(entity, rows):
+    names = columns(entity)
+    for row in rows:
+        yield json.dumps({name: export_value(value, 'ndjson') for name, value in zip(names, row)}) + '\n'
+
+
+def generate_csv(entity, rows):
+    # Reuse one small buffer so memory stays flat whatever the table size
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns(entity))
+    for row in rows:
+        writer.writerow([export_value(value, 'csv') for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def generate_export(entity, format, batch_size=1000):
+    rows = export_rows(entity, batch_size)
+    if format == 'csv':
+        return generate_csv(entity, rows)
+    return generate_ndjson(entity, rows)
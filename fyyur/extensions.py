@@ -0,0 +1,6 @@
+from .cache import Cache
+from .routing import RoutingSQLAlchemy
+
+# Bound to an app by create_app(); the other modules import them from here
+db = RoutingSQLAlchemy()
+cache = Cache()
@@ -0,0 +1,37 @@
+from datetime import timezone
+from functools import lru_cache
+
+# Named formats accepted by the datetime filter
+FORMATS = {
+    'full': "EEEE MMMM, d, y 'at' h:mma",
+    'medium': "EE MM, dd, y h:mma",
+}
+
+
+@lru_cache(maxsize=None)
+def compiled_pattern(format, locale=None):
+    # Parsed Babel pattern and locale for a (format, locale) pair, built once. Babel is only
+    # imported here, on the first page that formats a date, to keep it out of start-up
+    import babel.dates
+    from babel import Locale
+
+    pattern = babel.dates.parse_pattern(FORMATS.get(format, format))
+    return pattern, Locale.parse(locale or babel.dates.LC_TIME)
+
+
+def as_utc(value):
+    # Times are shown in UTC whatever the database session time zone; naive ones already are UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_datetime(value, format='medium', locale=None):
+    pattern, locale = compiled_pattern(format, locale)
+    return pattern.apply(as_utc(value), locale)
+
+
+def format_datetimes(values, format='medium', locale=None):
+    # Format a whole list of datetimes with a single pattern lookup
+    pattern, locale = compiled_pattern(format, locale)
+    return [pattern.apply(as_utc(value), locale) for value in values]
@@ -0,0 +1,43 @@
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+
+class FragmentCacheExtension(Extension):
+    # {% cache key, timeout %}...{% endcache %} renders the block once and serves it from
+    # environment.fragment_cache (any store with get and set) until it expires. A tuple key,
+    # e.g. ('venue-tile', venue.id, venue.version), is joined with ':'. The block is always
+    # rendered when no store is configured.
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None, fragment_cache_prefix='fragment:')
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        return nodes.CallBlock(self.call_method('_cache', args), [], [], body).set_lineno(lineno)
+
+    def _cache(self, key, timeout, caller):
+        store = self.environment.fragment_cache
+        if store is None:
+            return caller()
+
+        if isinstance(key, (tuple, list)):
+            key = ':'.join(map(str, key))
+        key = self.environment.fragment_cache_prefix + str(key)
+
+        fragment = store.get(key)
+        if fragment is None:
+            fragment = caller()
+            store.set(key, fragment, timeout)
+        # Stores that serialize may hand back a plain str, which autoescaping would escape again
+        return fragment if isinstance(fragment, Markup) else Markup(fragment)
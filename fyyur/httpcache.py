@@ -0,0 +1,143 @@
+import gzip
+import hashlib
+import time
+from functools import wraps
+
+from flask import make_response, request, session
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag, unquote_etag
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content types worth compressing; images and archives already are
+COMPRESSIBLE = ('text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml')
+
+# Part of every data version ETag, so pages rendered by an older deployment do not match
+RELEASE = format(int(time.time()), 'x')
+
+
+def cache_policy(max_age=None, private=False, no_cache=False, no_store=False, etag=None):
+    # Cache-Control policy of a view. With etag, a function of the view arguments returning a
+    # cheap data version, a matching If-None-Match is answered with 304 before the view runs.
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # A pending flash message is part of the page, whatever the data version
+            version = None
+            if etag is not None and not session.get('_flashes'):
+                version = f'{RELEASE}-{etag(*args, **kwargs)}'
+                if parse_etags(request.headers.get('If-None-Match')).contains_weak(version):
+                    response = make_response('', 304)
+                    response.set_etag(version, weak=True)
+                    return apply_policy(response)
+
+            response = make_response(view(*args, **kwargs))
+            if version is not None and response.status_code == 200:
+                response.set_etag(version, weak=True)
+            return apply_policy(response)
+
+        def apply_policy(response):
+            if max_age is not None:
+                response.cache_control.max_age = max_age
+            response.cache_control.private = private or None
+            response.cache_control.no_cache = no_cache or None
+            response.cache_control.no_store = no_store or None
+            return response
+
+        return wrapper
+    return decorator
+
+
+class HTTPCacheMiddleware:
+    # Adds a weak ETag computed from the body to GET responses that have none, answers a matching
+    # If-None-Match with 304, and compresses responses of at least min_size bytes with brotli or
+    # gzip, as negotiated with Accept-Encoding. Only responses with a Content-Length are buffered
+    # and changed; streamed responses (exports) pass through as they are.
+
+    def __init__(self, app, min_size=1024, level=6):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+
+    def __call__(self, environ, start_response):
+        captured = dict()
+
+        def capture(status, headers, exc_info=None):
+            captured.update(status=status, headers=headers, exc_info=exc_info)
+
+        chunks = self.app(environ, capture)
+        status, headers = captured['status'], Headers(captured['headers'])
+        if 'Content-Length' not in headers or status[:3] not in ('200', '203'):
+            start_response(status, headers.to_wsgi_list(), captured['exc_info'])
+            return chunks
+
+        cache_control = headers.get('Cache-Control', '')
+        # A HEAD response has no body to hash or compress; it keeps the ETag and Content-Length
+        # the app gave it, as they are for the uncompressed GET response
+        head = environ['REQUEST_METHOD'] == 'HEAD'
+        validate = environ['REQUEST_METHOD'] in ('GET', 'HEAD') and 'no-store' not in cache_control
+        compressible = headers.get('Content-Type', '').startswith(COMPRESSIBLE) and 'no-transform' not in cache_control
+        encoding = self.encoding(environ) if compressible and not head and 'Content-Encoding' not in headers else None
+        if encoding and int(headers['Content-Length']) < self.min_size:
+            encoding = None
+
+        if compressible:
+            # Vary whether or not this response is compressed, so shared caches keep both
+            vary = headers.get('Vary')
+            if not vary or 'accept-encoding' not in vary.lower():
+                headers['Vary'] = f'{vary}, Accept-Encoding' if vary else 'Accept-Encoding'
+
+        # Only buffer the body when it is needed for an ETag or to compress it
+        body = None
+        if (validate and not head and 'ETag' not in headers) or encoding:
+            try:
+                body = b''.join(chunks)
+            finally:
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+            if validate and not head and 'ETag' not in headers:
+                headers['ETag'] = quote_etag(hashlib.sha1(body).hexdigest()[:20], weak=True)
+
+        if validate and 'ETag' in headers and self.not_modified(environ, headers['ETag']):
+            if body is None and hasattr(chunks, 'close'):
+                chunks.close()
+            for header in ('Content-Length', 'Content-Type', 'Content-Encoding'):
+                headers.remove(header)
+            start_response('304 NOT MODIFIED', headers.to_wsgi_list())
+            return []
+
+        if body is None:
+            start_response(status, headers.to_wsgi_list())
+            return chunks
+
+        if encoding:
+            body = self.compress(body, encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Content-Length'] = str(len(body))
+            # The compressed bytes differ from the ones a strong ETag was computed from
+            etag = headers.get('ETag')
+            if etag and not etag.startswith('W/'):
+                headers['ETag'] = 'W/' + etag
+
+        start_response(status, headers.to_wsgi_list())
+        return [body]
+
+    def not_modified(self, environ, etag):
+        # Weak comparison: the same entity matches whatever its encoding
+        return parse_etags(environ.get('HTTP_IF_NONE_MATCH')).contains_weak(unquote_etag(etag)[0])
+
+    def encoding(self, environ):
+        accepted = parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING'))
+        if brotli is not None and accepted['br']:
+            return 'br'
+        if accepted['gzip']:
+            return 'gzip'
+        return None
+
+    def compress(self, body, encoding):
+        if encoding == 'br':
+            return brotli.compress(body, quality=min(self.level, 11))
+        return gzip.compress(body, self.level)
@@ -0,0 +1,198 @@
+import csv
+import json
+from datetime import timezone
+from itertools import islice
+
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import MultiDict
+
+from .cache import venue_key, artist_key
+from .counters import record_new_shows
+from .extensions import db, cache
+from .models import Venue, Artist, Show
+
+# Forms of fyyur.forms validating the rows of each entity
+FORMS = {
+    'venues': 'VenueForm',
+    'artists': 'ArtistForm',
+    'shows': 'ShowForm',
+}
+
+# Fields a row must carry itself rather than take the form's default: ShowForm defaults
+# start_time to the time fyyur.forms was imported
+REQUIRED = {
+    'shows': ('start_time',),
+}
+
+TABLES = {
+    'venues': Venue.__table__,
+    'artists': Artist.__table__,
+    'shows': Show.__table__,
+}
+
+
+class ImportResult:
+    # Number of inserted rows and the errors of every rejected row, by line number
+
+    def __init__(self):
+        self.inserted = 0
+        self.errors = list()
+
+    def reject(self, line, errors):
+        self.errors.append((line, errors))
+
+    def to_dict(self):
+        return {
+            'inserted': self.inserted,
+            'rejected': len(self.errors),
+            'errors': [{'line': line, 'errors': errors} for line, errors in self.errors],
+        }
+
+
+def read_rows(stream, format):
+    # Yield (line, row) pairs from a CSV or NDJSON text stream; row is None if the line is unreadable
+    if format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        for line, text in enumerate(stream, 1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text)
+            except ValueError:
+                yield line, None
+
+
+def to_formdata(row):
+    # Lists (NDJSON) or ';' separated strings (CSV) become repeated form fields
+    formdata = MultiDict()
+    for key, value in row.items():
+        if key == 'genres' and isinstance(value, str):
+            value = [genre.strip() for genre in value.split(';') if genre.strip()]
+        if isinstance(value, list):
+            formdata.setlist(key, [str(item) for item in value])
+        elif isinstance(value, bool):
+            # BooleanField treats any non-empty string as checked
+            formdata[key] = 'y' if value else ''
+        elif value is not None:
+            formdata[key] = str(value)
+    return formdata
+
+
+def validate_row(entity, row):
+    # Column values for a row that passes the form's rules, or the form errors
+    from . import forms  # WTForms (and Babel, through Flask-WTF) are kept out of start-up
+
+    missing = [field for field in REQUIRED.get(entity, ()) if row.get(field) is None or not str(row[field]).strip()]
+    if missing:
+        return None, {field: ['This field is required.'] for field in missing}
+
+    form = getattr(forms, FORMS[entity])(formdata=to_formdata(row), meta={'csrf': False})
+    if not form.validate():
+        return None, form.errors
+
+    values = {column.name: form.data[column.name] for column in TABLES[entity].columns if column.name in form.data}
+    # Blank optional fields are stored as NULL, which the export writes as blank
+    for column in TABLES[entity].columns:
+        if column.nullable and values.get(column.name) == '':
+            values[column.name] = None
+    if entity == 'shows':
+        try:
+            values['artist_id'] = int(values['artist_id'])
+            values['venue_id'] = int(values['venue_id'])
+        except (TypeError, ValueError):
+            return None, {'show': ['artist_id and venue_id must be integers.']}
+        values['start_time'] = values['start_time'].replace(tzinfo=timezone.utc)
+    return values, None
+
+
+def check_shows(rows, result):
+    # Reject shows with unknown artists or venues, or that already exist, with one query each
+    artist_ids = {id for id, in db.session.query(Artist.id).filter(Artist.id.in_({values['artist_id'] for _, values in rows}))}
+    venue_ids = {id for id, in db.session.query(Venue.id).filter(Venue.id.in_({values['venue_id'] for _, values in rows}))}
+    keys = [(values['artist_id'], values['venue_id'], values['start_time']) for _, values in rows]
+    existing = set(db.session.query(Show.artist_id, Show.venue_id, Show.start_time)
+                   .filter(db.tuple_(Show.artist_id, Show.venue_id, Show.start_time).in_(keys)))
+
+    valid = list()
+    for line, values in rows:
+        key = (values['artist_id'], values['venue_id'], values['start_time'])
+        if values['artist_id'] not in artist_ids:
+            result.reject(line, {'artist_id': [f"Artist {values['artist_id']} does not exist."]})
+        elif values['venue_id'] not in venue_ids:
+            result.reject(line, {'venue_id': [f"Venue {values['venue_id']} does not exist."]})
+        elif key in existing:
+            result.reject(line, {'show': ['This show is already listed.']})
+        else:
+            existing.add(key)
+            valid.append((line, values))
+    return valid
+
+
+def count_shows(rows):
+    record_new_shows([(values['artist_id'], values['venue_id'], values['start_time']) for values in rows])
+
+
+def insert_rows(table, rows, result, before_commit=None):
+    # Insert a chunk with one executemany; if the database rejects it, retry row by row to find the bad ones
+    try:
+        db.session.execute(table.insert(), [values for _, values in rows])
+        if before_commit:
+            before_commit([values for _, values in rows])
+        db.session.commit()
+        result.inserted += len(rows)
+        return [values for _, values in rows]
+    except SQLAlchemyError:
+        db.session.rollback()
+
+    inserted = list()
+    for line, values in rows:
+        try:
+            db.session.execute(table.insert(), values)
+            if before_commit:
+                before_commit([values])
+            db.session.commit()
+            result.inserted += 1
+            inserted.append(values)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            result.reject(line, {'database': [str(getattr(e, 'orig', e))]})
+    return inserted
+
+
+def import_rows(entity, rows, chunk_size=1000):
+    # Validate and insert (line, row) pairs chunk by chunk, one transaction per chunk
+    result = ImportResult()
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+
+        valid = list()
+        for line, row in chunk:
+            if not isinstance(row, dict):
+                result.reject(line, {'row': ['Could not be parsed.']})
+                continue
+            values, errors = validate_row(entity, row)
+            if errors:
+                result.reject(line, errors)
+            else:
+                valid.append((line, values))
+
+        if entity == 'shows' and valid:
+            valid = check_shows(valid, result)
+        if valid:
+            inserted = insert_rows(TABLES[entity], valid, result, count_shows if entity == 'shows' else None)
+            if entity == 'shows':
+                cache.delete(*{venue_key(values['venue_id']) for values in inserted},
+                             *{artist_key(values['artist_id']) for values in inserted})
+
+    result.errors.sort(key=lambda error: error[0])
+    return result
+
+
+def import_stream(entity, stream, format, chunk_size=1000):
+    return import_rows(entity, read_rows(stream, format), chunk_size)
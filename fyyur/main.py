@@ -0,0 +1,79 @@
+import codecs
+from datetime import datetime, timezone
+
+from flask import Blueprint, current_app, render_template, request, Response, g, jsonify, stream_with_context
+
+from .exporter import generate_export, MIMETYPES
+from .extensions import db
+from .formatting import format_datetime
+from .httpcache import cache_policy
+from .importer import import_stream
+
+main_bp = Blueprint('main', __name__)
+
+main_bp.add_app_template_filter(format_datetime, 'datetime')
+
+
+@main_bp.before_app_request
+def set_request_time():
+    # Single timezone-aware reference time for every past/upcoming comparison in a request
+    g.now = datetime.now(timezone.utc)
+
+
+@main_bp.route('/')
+@cache_policy(private=True, no_cache=True)
+def index():
+    return render_template('pages/home.html')
+
+
+#  Import
+#  ----------------------------------------------------------------
+
+@main_bp.route('/import/<any(venues, artists, shows):entity>', methods=['POST'])
+def import_data(entity):
+    # Bulk import venues, artists or shows from an uploaded (or raw body) CSV or NDJSON file
+    upload = request.files.get('file')
+    stream = upload.stream if upload else request.stream
+    format = request.args.get('format') or ('csv' if upload and upload.filename.endswith('.csv') else 'ndjson')
+
+    result = import_stream(entity, codecs.iterdecode(stream, 'utf-8'), format, current_app.config['IMPORT_CHUNK_SIZE'])
+
+    return jsonify(result.to_dict())
+
+#  Export
+#  ----------------------------------------------------------------
+
+@main_bp.route('/export/<any(venues, artists, shows):entity>.<any(csv, ndjson):format>')
+def export_data(entity, format):
+    # Stream the whole table without loading it in memory
+    rows = generate_export(entity, format, current_app.config['EXPORT_BATCH_SIZE'])
+    return Response(stream_with_context(rows), mimetype=MIMETYPES[format])
+
+#  Admin
+#  ----------------------------------------------------------------
+
+def engine_pool_stats(engine):
+    pool = engine.pool
+    if not hasattr(pool, 'stats'):
+        return {'pool': type(pool).__name__, 'status': pool.status()}
+    return pool.stats()
+
+@main_bp.route('/admin/pool')
+@cache_policy(no_store=True)
+def pool_stats():
+    # Live connection pool statistics of the primary, and of each replica under 'replicas'
+    stats = engine_pool_stats(db.engine)
+    if db.replica_keys:
+        stats['replicas'] = {key: engine_pool_stats(db.get_engine(current_app, bind=key)) for key in db.replica_keys}
+    return jsonify(stats)
+
+#  Errors
+#  ----------------------------------------------------------------
+
+@main_bp.app_errorhandler(404)
+def not_found_error(error):
+    return render_template('errors/404.html'), 404
+
+@main_bp.app_errorhandler(500)
+def server_error(error):
+    return render_template('errors/500.html'), 500
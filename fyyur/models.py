@@ -0,0 +1,86 @@
+from .extensions import db
+
+
+class Show(db.Model):
+    __tablename__ = 'show'
+    __table_args__ = (
+        db.Index('ix_show_venue_id_start_time', 'venue_id', 'start_time'),
+        db.Index('ix_show_start_time', 'start_time'),
+        db.Index('ix_show_artist_id_start_time_venue_id', 'artist_id', 'start_time', 'venue_id'),
+    )
+
+    artist_id = db.Column(db.Integer, db.ForeignKey('artist.id'), primary_key=True)
+    venue_id = db.Column(db.Integer, db.ForeignKey('venue.id'), primary_key=True)
+    start_time = db.Column(db.DateTime(timezone=True), primary_key=True)
+    artist = db.relationship('Artist', back_populates='venues')
+    venue = db.relationship('Venue', back_populates='artists')
+
+class Venue(db.Model):
+    __tablename__ = 'venue'
+    __table_args__ = (
+        db.Index('ix_venue_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String, nullable=False)
+    city = db.Column(db.String(120), nullable=False)
+    state = db.Column(db.String(120), nullable=False)
+    address = db.Column(db.String(120), nullable=False)
+    phone = db.Column(db.String(120), nullable=False)
+    facebook_link = db.Column(db.String(120))
+    genres = db.Column(db.ARRAY(db.String), nullable=False)
+    website = db.Column(db.String(120))
+    seeking_talent = db.Column(db.Boolean, nullable=False, default=False)
+    seeking_description = db.Column(db.String(500))
+    image_link = db.Column(db.String(500), nullable=False)
+    upcoming_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Bumped by every ORM update of the row; keys the cached listing tiles
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+    artists = db.relationship('Show', back_populates='venue')
+
+    __mapper_args__ = {'version_id_col': version}
+
+
+class Artist(db.Model):
+    __tablename__ = 'artist'
+    __table_args__ = (
+        db.Index('ix_artist_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String, nullable=False)
+    city = db.Column(db.String(120), nullable=False)
+    state = db.Column(db.String(120), nullable=False)
+    phone = db.Column(db.String(120), nullable=False)
+    genres = db.Column(db.ARRAY(db.String), nullable=False)
+    image_link = db.Column(db.String(500), nullable=False)
+    facebook_link = db.Column(db.String(120))
+    website = db.Column(db.String(120))
+    seeking_venue = db.Column(db.Boolean, nullable=False, default=False)
+    seeking_description = db.Column(db.String(500))
+    upcoming_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Bumped by every ORM update of the row; keys the cached listing tiles
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+    venues = db.relationship('Show', back_populates='artist')
+
+    __mapper_args__ = {'version_id_col': version}
+
+
+def search_document(model):
+    # Text searched for a venue or artist: its name, city, state and genres
+    return model.name + ' ' + model.city + ' ' + model.state + ' ' + db.func.genres_text(model.genres)
+
+
+# Trigram indexes of the search documents; genres_text() is created by their migration
+db.Index('ix_venue_search_trgm', search_document(Venue).label('document'),
+         postgresql_using='gin', postgresql_ops={'document': 'gin_trgm_ops'})
+db.Index('ix_artist_search_trgm', search_document(Artist).label('document'),
+         postgresql_using='gin', postgresql_ops={'document': 'gin_trgm_ops'})
+
+
+class CounterSync(db.Model):
+    __tablename__ = 'counter_sync'
+
+    # Single row: upcoming_shows_count columns count the shows starting after synced_at
+    id = db.Column(db.Integer, primary_key=True)
+    synced_at = db.Column(db.DateTime(timezone=True), nullable=False)
\ No newline at end of file
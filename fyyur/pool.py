@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.util.queue import Queue
+
+
+class TimedQueue(Queue):
+    # The pool's queue of idle connections, reporting how long each get() blocked on it
+
+    def __init__(self, maxsize, use_lifo, record_wait):
+        super().__init__(maxsize, use_lifo=use_lifo)
+        self.record_wait = record_wait
+
+    def get(self, block=True, timeout=None):
+        if not block:
+            return super().get(block, timeout)
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.record_wait(time.perf_counter() - started)
+
+
+class MeteredQueuePool(QueuePool):
+    # QueuePool that records how many checkouts there were and how long they waited for a
+    # connection to be checked in. Only the wait on the queue is timed: opening a new connection,
+    # the pre-ping and the checkout events are not waiting on the pool, and are left out.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = TimedQueue(self._pool.maxsize, self._pool.use_lifo, self._record_wait)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._failures = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def connect(self):
+        try:
+            return super().connect()
+        except Exception:
+            with self._stats_lock:
+                self._failures += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self._checkouts += 1
+
+    def _record_wait(self, waited):
+        with self._stats_lock:
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def stats(self):
+        # size: connections kept open; checked_in: idle ones; checked_out: in use; overflow: open
+        # beyond size, up to max_overflow (QueuePool counts size unopened connections as negative
+        # overflow, reported as 0); checkouts: connections requested; failed_checkouts: requests
+        # that timed out or could not connect; wait_seconds_*: time blocked waiting for a
+        # connection to be checked in, over all checkouts
+        with self._stats_lock:
+            return {
+                'size': self.size(),
+                'checked_in': self.checkedin(),
+                'checked_out': self.checkedout(),
+                'overflow': max(self.overflow(), 0),
+                'max_overflow': self._max_overflow,
+                'checkouts': self._checkouts,
+                'failed_checkouts': self._failures,
+                'wait_seconds_total': round(self._wait_total, 6),
+                'wait_seconds_max': round(self._wait_max, 6),
+                'wait_seconds_avg': round(self._wait_total / self._checkouts, 6) if self._checkouts else 0.0,
+            }
+
+
+# SQLAlchemy names a pool's logger after its class, fyyur.pool.MeteredQueuePool: keep its
+# checkout, pre-ping and return messages out of the app's fyyur logger and its error.log
+logging.getLogger(f'{__name__}.{MeteredQueuePool.__name__}').propagate = False
@@ -0,0 +1,130 @@
+import threading
+import time
+from bisect import bisect_left
+
+from flask import current_app, g, has_app_context, has_request_context, request, Response, before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds of the histogram buckets
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    # Prometheus histogram with one series per endpoint
+
+    def __init__(self, name, help, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self._series = dict()
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint, value):
+        with self._lock:
+            counts, total = self._series.get(endpoint, ([0] * (len(self.buckets) + 1), 0))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._series[endpoint] = (counts, total + value)
+
+    def lines(self):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        with self._lock:
+            series = sorted((endpoint, list(counts), total) for endpoint, (counts, total) in self._series.items())
+        for endpoint, counts, total in series:
+            label = 'endpoint="{}"'.format(endpoint.replace('\\', '\\\\').replace('"', '\\"'))
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{label},le="{bound}"}} {cumulative}'
+            yield f'{self.name}_sum{{{label}}} {total}'
+            yield f'{self.name}_count{{{label}}} {cumulative}'
+
+
+# The start time is kept on the statement's execution context, which is discarded with it when
+# the statement fails, rather than on the pooled connection where it would accumulate
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    profiler = current_app.extensions.get('profiler') if has_app_context() else None
+    if profiler is not None:
+        profiler.record_query(statement, parameters, elapsed)
+
+
+class RequestProfiler:
+    # Per-request query count, database time, template render time and latency, reported in a
+    # Server-Timing header and aggregated per endpoint into histograms served at /metrics.
+    # Queries slower than SLOW_QUERY_MS are logged with their parameters.
+
+    def __init__(self, app):
+        self.app = app
+        self.slow_query_seconds = app.config['SLOW_QUERY_MS'] / 1000
+        self.histograms = {
+            'latency': Histogram('fyyur_request_duration_seconds', 'Total request latency in seconds.', SECONDS_BUCKETS),
+            'db': Histogram('fyyur_request_db_seconds', 'Time spent in SQL queries per request, in seconds.', SECONDS_BUCKETS),
+            'render': Histogram('fyyur_request_render_seconds', 'Time spent rendering templates per request, in seconds.', SECONDS_BUCKETS),
+            'queries': Histogram('fyyur_request_queries', 'Number of SQL queries per request.', QUERY_BUCKETS),
+        }
+
+        # Listening on the Engine class covers the primary and every replica engine, of every app;
+        # each query is then recorded by the profiler of the current app
+        if not event.contains(Engine, 'after_cursor_execute', after_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+        app.extensions['profiler'] = self
+        before_render_template.connect(self.before_render, app)
+        template_rendered.connect(self.after_render, app)
+        app.before_request(self.start_request)
+        app.after_request(self.finish_request)
+        app.add_url_rule('/metrics', 'metrics', self.metrics)
+
+    def record_query(self, statement, parameters, elapsed):
+        if has_request_context() and 'profile' in g:
+            g.profile['queries'] += 1
+            g.profile['db'] += elapsed
+        if elapsed >= self.slow_query_seconds:
+            self.app.logger.warning('Slow query (%.1f ms) in %s: %s; parameters: %.1000r',
+                                    elapsed * 1000, request.endpoint if has_request_context() else 'cli',
+                                    ' '.join(statement.split()), parameters)
+
+    def before_render(self, sender, template, context, **extra):
+        if 'profile' in g:
+            g.profile['render_started'] = time.perf_counter()
+
+    def after_render(self, sender, template, context, **extra):
+        if 'profile' in g:
+            g.profile['render'] += time.perf_counter() - g.profile['render_started']
+
+    def start_request(self):
+        g.profile = {'started': time.perf_counter(), 'queries': 0, 'db': 0.0, 'render': 0.0}
+
+    def finish_request(self, response):
+        # Streamed bodies (exports) are generated after this point and are not included
+        profile = g.pop('profile', None)
+        if profile is None or request.endpoint == 'metrics':
+            return response
+        latency = time.perf_counter() - profile['started']
+        endpoint = request.endpoint or 'unmatched'
+
+        self.histograms['latency'].observe(endpoint, latency)
+        self.histograms['db'].observe(endpoint, profile['db'])
+        self.histograms['render'].observe(endpoint, profile['render'])
+        self.histograms['queries'].observe(endpoint, profile['queries'])
+
+        response.headers.add('Server-Timing', ', '.join([
+            f'db;dur={profile["db"] * 1000:.1f};desc="{profile["queries"]} queries"',
+            f'render;dur={profile["render"] * 1000:.1f}',
+            f'total;dur={latency * 1000:.1f}',
+        ]))
+        return response
+
+    def metrics(self):
+        # Histograms of this process in the Prometheus text exposition format
+        lines = [line for histogram in self.histograms.values() for line in histogram.lines()]
+        return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,155 @@
+import base64
+import re
+from datetime import datetime
+from itertools import groupby
+
+from .extensions import db
+from .models import Venue, Artist, Show, search_document
+from .viewmodels import Tile, VenueArea, VENUE_FIELDS, ARTIST_FIELDS
+
+
+def venue_areas():
+    # Build the city,state -> venues -> upcoming show count tree with a single query
+    rows = db.session.query(
+        Venue.city,
+        Venue.state,
+        Venue.id,
+        Venue.name,
+        Venue.upcoming_shows_count.label('num_upcoming_shows'),
+        Venue.version,
+    ).order_by(Venue.city, Venue.state, Venue.id).all()
+
+    return [VenueArea(city, state, [Tile(venue.id, venue.name, venue.num_upcoming_shows, venue.version) for venue in venues])
+            for (city, state), venues in groupby(rows, key=lambda row: (row.city, row.state))]
+
+
+def listing(model, limit, offset=0):
+    # A page of venues or artists with their number of upcoming shows, in id order
+    return db.session.query(
+        model.id,
+        model.name,
+        model.city,
+        model.state,
+        model.upcoming_shows_count.label('num_upcoming_shows')
+    ).order_by(model.id).limit(limit).offset(offset).all()
+
+
+def listing_version(model):
+    # Changes whenever a venue or artist is added, edited or deleted; the data version of the listings
+    count, versions, last_id = db.session.query(
+        db.func.count(model.id),
+        db.func.coalesce(db.func.sum(model.version), 0),
+        db.func.coalesce(db.func.max(model.id), 0),
+    ).one()
+    return f'{count}-{versions}-{last_id}'
+
+
+def venue_details(venue_id):
+    # The venue columns shown on its page, without loading the entity
+    return db.session.query(*[getattr(Venue, field) for field in VENUE_FIELDS]).filter(Venue.id == venue_id).first()
+
+
+def artist_details(artist_id):
+    # The artist columns shown on its page, without loading the entity
+    return db.session.query(*[getattr(Artist, field) for field in ARTIST_FIELDS]).filter(Artist.id == artist_id).first()
+
+
+def search(model, search_term, limit, offset=0):
+    # Every word of the search term (e.g. "San Francisco, CA") must appear in the
+    # name, city, state or genres; results are ranked by similarity to the name
+    document = search_document(model)
+    words = [word for word in re.split(r'[\s,]+', search_term) if word]
+
+    rows = db.session.query(
+        model.id,
+        model.name,
+        model.upcoming_shows_count.label('num_upcoming_shows'),
+        db.func.count().over().label('total')
+    ).filter(*[document.ilike(f'%{word}%') for word in words]) \
+        .order_by(db.func.similarity(model.name, search_term).desc(), model.name, model.id) \
+        .limit(limit).offset(offset).all()
+
+    total = rows[0].total if rows else 0
+
+    return total, rows
+
+
+def venue_shows(venue_id, now):
+    # Past and upcoming shows of a venue with their artist columns, from a single query
+    shows = db.session.query(
+        Show.artist_id,
+        Artist.name.label('artist_name'),
+        Artist.image_link.label('artist_image_link'),
+        Show.start_time,
+    ).join(Artist, Artist.id == Show.artist_id) \
+        .filter(Show.venue_id == venue_id).order_by(Show.start_time).all()
+
+    return split_shows(shows, now)
+
+
+def artist_shows(artist_id, now):
+    # Past and upcoming shows of an artist with their venue columns, from a single query
+    shows = db.session.query(
+        Show.venue_id,
+        Venue.name.label('venue_name'),
+        Venue.image_link.label('venue_image_link'),
+        Show.start_time,
+    ).join(Venue, Venue.id == Show.venue_id) \
+        .filter(Show.artist_id == artist_id).order_by(Show.start_time).all()
+
+    return split_shows(shows, now)
+
+
+def split_shows(shows, now):
+    # Partition start_time ordered shows into (past, upcoming) around now
+    past_shows = [show for show in shows if show.start_time < now]
+    upcoming_shows = shows[len(past_shows):]
+
+    return past_shows, upcoming_shows
+
+
+def encode_show_cursor(show):
+    # Opaque cursor pointing just after the given show in (start_time, artist_id, venue_id) order
+    key = f'{show.start_time.isoformat()}|{show.artist_id}|{show.venue_id}'
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_show_cursor(cursor):
+    # Raises ValueError on a malformed cursor
+    start_time, artist_id, venue_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+    return datetime.fromisoformat(start_time), int(artist_id), int(venue_id)
+
+
+def show_page(now, limit, cursor=None, when=None, venue_id=None, artist_id=None, start=None, end=None):
+    # One page of shows ordered by (start_time, artist_id, venue_id), resuming after the cursor
+    shows = db.session.query(
+        Show.venue_id,
+        Venue.name.label('venue_name'),
+        Show.artist_id,
+        Artist.name.label('artist_name'),
+        Artist.image_link.label('artist_image_link'),
+        Show.start_time,
+        Venue.version.label('venue_version'),
+        Artist.version.label('artist_version'),
+    ).join(Artist, Artist.id == Show.artist_id).join(Venue, Venue.id == Show.venue_id)
+
+    if when == 'upcoming':
+        shows = shows.filter(Show.start_time > now)
+    elif when == 'past':
+        shows = shows.filter(Show.start_time < now)
+    if venue_id is not None:
+        shows = shows.filter(Show.venue_id == venue_id)
+    if artist_id is not None:
+        shows = shows.filter(Show.artist_id == artist_id)
+    if start is not None:
+        shows = shows.filter(Show.start_time >= start)
+    if end is not None:
+        shows = shows.filter(Show.start_time < end)
+    if cursor is not None:
+        shows = shows.filter(db.tuple_(Show.start_time, Show.artist_id, Show.venue_id) > decode_show_cursor(cursor))
+
+    # Fetch one extra row to find out whether there is a next page
+    rows = shows.order_by(Show.start_time, Show.artist_id, Show.venue_id).limit(limit + 1).all()
+    next_cursor = encode_show_cursor(rows[limit - 1]) if len(rows) > limit else None
+
+    return rows[:limit], next_cursor
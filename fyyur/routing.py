@@ -0,0 +1,74 @@
+import random
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_request_context, request, session
+from flask_sqlalchemy import SQLAlchemy, SignallingSession, get_state
+from sqlalchemy import orm
+
+# Requests that never write, and may therefore read from a replica
+READ_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+def replica_binds(uris):
+    # SQLALCHEMY_BINDS entries for the replica URIs
+    return {f'replica_{index}': uri for index, uri in enumerate(uris)}
+
+
+def reads_from_replica():
+    # Read-only requests use a replica, unless the same client wrote recently or the queries
+    # run in a db.on_primary() block
+    if not has_request_context() or request.method not in READ_METHODS or g.get('primary_reads'):
+        return False
+    return session.get('primary_until', 0) <= time.time()
+
+
+class RoutingSession(SignallingSession):
+    # Session that runs the queries of read-only requests on a replica and everything else on the primary
+
+    def get_bind(self, mapper=None, clause=None):
+        replica_keys = self.app.extensions['replicas']
+        if replica_keys and not self._flushing and reads_from_replica():
+            # Stay on one replica for the whole request so its reads see a single snapshot
+            if getattr(self, '_replica_key', None) is None:
+                self._replica_key = random.choice(replica_keys)
+            return get_state(self.app).db.get_engine(self.app, bind=self._replica_key)
+        return super().get_bind(mapper, clause)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    # SQLAlchemy whose sessions route reads to the SQLALCHEMY_REPLICA_URIS databases
+
+    def init_app(self, app):
+        replicas = replica_binds(app.config.get('SQLALCHEMY_REPLICA_URIS', ()))
+        app.config['SQLALCHEMY_BINDS'] = dict(app.config.get('SQLALCHEMY_BINDS') or {}, **replicas)
+        # Kept per app: the same db serves every app create_app() makes
+        app.extensions['replicas'] = tuple(replicas)
+        if replicas:
+            app.after_request(self.stick_to_primary)
+        super().init_app(app)
+
+    @property
+    def replica_keys(self):
+        # Bind keys of the current app's replicas
+        return current_app.extensions['replicas']
+
+    @contextmanager
+    def on_primary(self):
+        # Run the queries of the block on the primary, even in a read-only request
+        depth = g.get('primary_reads', 0)
+        g.primary_reads = depth + 1
+        try:
+            yield
+        finally:
+            g.primary_reads = depth
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+    def stick_to_primary(self, response):
+        # After a successful write, read from the primary for a while so the client sees its own
+        # changes (e.g. on the page a form redirects to) before the replicas have caught up
+        if request.method not in READ_METHODS and response.status_code < 400:
+            session['primary_until'] = time.time() + current_app.config['REPLICA_STICKY_SECONDS']
+        return response
@@ -0,0 +1,107 @@
+import sys
+from datetime import datetime, timezone
+
+from flask import Blueprint, current_app, render_template, request, flash, url_for, abort, g
+
+from .cache import venue_key, artist_key
+from .counters import record_new_shows
+from .extensions import db, cache
+from .httpcache import cache_policy
+from .models import Show
+from .queries import show_page
+from .viewmodels import with_start_times, ShowItem
+
+shows_bp = Blueprint('shows', __name__)
+
+
+def parse_date(value):
+    # Parse a YYYY-MM-DD query string value as a UTC date
+    return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+
+def show_filters(args):
+    # The /shows filters of a query string. Like a bad cursor, a value that does not parse raises
+    # ValueError rather than silently dropping its filter.
+    when = args.get('when') or None
+    if when not in (None, 'upcoming', 'past'):
+        raise ValueError(f'when must be upcoming or past, not {when!r}')
+    return {
+        'when': when,
+        'venue_id': parse_arg(args, 'venue_id', int),
+        'artist_id': parse_arg(args, 'artist_id', int),
+        'start': parse_arg(args, 'from', parse_date),
+        'end': parse_arg(args, 'to', parse_date),
+    }
+
+def parse_arg(args, name, parse):
+    # None when the argument is absent or empty
+    value = args.get(name)
+    return parse(value) if value else None
+
+def parse_start_time(value):
+    # Show times are entered as UTC unless they carry an offset
+    start_time = datetime.fromisoformat(value)
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time
+
+
+@shows_bp.route('/shows')
+@cache_policy(private=True, no_cache=True)
+def shows():
+    # displays a page of shows at /shows, optionally filtered
+    try:
+        shows, next_cursor = show_page(
+            g.now,
+            current_app.config['SHOWS_PER_PAGE'],
+            cursor=request.args.get('cursor'),
+            **show_filters(request.args)
+        )
+    except ValueError:
+        abort(400)
+
+    data = with_start_times(ShowItem, shows)
+
+    # Keep the filters on the link to the next page
+    next_url = None
+    if next_cursor:
+        next_url = url_for('shows.shows', cursor=next_cursor, **{k: v for k, v in request.args.items() if k != 'cursor'})
+
+    return render_template('pages/shows.html', shows=data, next_url=next_url)
+
+@shows_bp.route('/shows/create')
+def create_shows():
+    # renders form. do not touch.
+    from .forms import ShowForm  # WTForms (and Babel, via Flask-WTF) load on first use
+
+    form = ShowForm()
+    return render_template('forms/new_show.html', form=form)
+
+@shows_bp.route('/shows/create', methods=['POST'])
+def create_show_submission():
+    error = False
+
+    try:
+        parsed_form = {
+            'artist_id': int(request.form.get('artist_id')),
+            'venue_id': int(request.form.get('venue_id')),
+            'start_time': parse_start_time(request.form.get('start_time')),
+        }
+        show = Show(**parsed_form)
+        db.session.add(show)
+        record_new_shows([(show.artist_id, show.venue_id, show.start_time)])
+        db.session.commit()
+        cache.delete(venue_key(parsed_form['venue_id']), artist_key(parsed_form['artist_id']))
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful db insert, flash error
+        flash(f"Oops! Show could not be listed.")
+    else:
+        # on successful db insert, flash success
+        flash(f"Show was successfully listed!")
+
+    return render_template('pages/home.html')
@@ -0,0 +1,76 @@
+from datetime import datetime
+from itertools import islice
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import venue_key, artist_key
+from .counters import record_new_shows
+from .extensions import db, cache
+from .importer import ImportResult, validate_row, check_shows
+from .models import Show
+
+SHOW_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def expand_recurrence(venue_id, start_time, rule, limit):
+    # (venue_id, start_time) dates of a residency described by an RRULE such as FREQ=WEEKLY;COUNT=10
+    from dateutil.rrule import rrulestr  # only residencies need it; kept out of start-up
+
+    dtstart = datetime.strptime(start_time, SHOW_TIME_FORMAT)
+    occurrences = list(islice(rrulestr(rule, dtstart=dtstart), limit + 1))
+    return [{'venue_id': venue_id, 'start_time': occurrence.strftime(SHOW_TIME_FORMAT)} for occurrence in occurrences]
+
+
+def tour_dates(data, limit):
+    # The list of dates of a tour, or the expanded dates of a recurring residency
+    if 'rrule' in data:
+        return expand_recurrence(data.get('venue_id'), data.get('start_time', ''), data['rrule'], limit)
+    return data.get('dates') or list()
+
+
+def book_tour(data, limit):
+    # Validate every date of a tour and insert them all in one statement, or none of them
+    result = ImportResult()
+    try:
+        dates = tour_dates(data, limit)
+    except (ValueError, TypeError, AttributeError):
+        result.reject(0, {'rrule': ['Could not expand the recurrence rule.']})
+        return result
+    if not isinstance(dates, list):
+        result.reject(0, {'dates': ['Must be a list of {"venue_id", "start_time"} objects.']})
+        return result
+    if not dates:
+        result.reject(0, {'dates': ['A tour needs at least one date.']})
+        return result
+    if len(dates) > limit:
+        result.reject(0, {'dates': [f'A tour can have at most {limit} dates.']})
+        return result
+
+    rows = list()
+    for index, date in enumerate(dates):
+        if not isinstance(date, dict):
+            result.reject(index, {'date': ['Must be an object with venue_id and start_time.']})
+            continue
+        values, errors = validate_row('shows', {**date, 'artist_id': data.get('artist_id')})
+        if errors:
+            result.reject(index, errors)
+        else:
+            rows.append((index, values))
+    if rows:
+        rows = check_shows(rows, result)
+    if result.errors:
+        result.errors.sort(key=lambda error: error[0])
+        return result
+
+    try:
+        db.session.execute(Show.__table__.insert().values([values for _, values in rows]))
+        record_new_shows([(values['artist_id'], values['venue_id'], values['start_time']) for _, values in rows])
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        result.reject(0, {'database': [str(getattr(e, 'orig', e))]})
+        return result
+    result.inserted = len(rows)
+
+    cache.delete(artist_key(rows[0][1]['artist_id']), *{venue_key(values['venue_id']) for _, values in rows})
+    return result
@@ -0,0 +1,211 @@
+import sys
+
+from flask import Blueprint, current_app, render_template, request, flash, redirect, url_for, abort, g
+
+from .cache import venue_key, artist_key, page_timeout
+from .counters import forget_venue_shows
+from .extensions import db, cache
+from .httpcache import cache_policy
+from .models import Venue, Show
+from .queries import venue_areas, search, listing_version, venue_details, venue_shows
+from .viewmodels import summaries, venue_page
+
+venues_bp = Blueprint('venues', __name__)
+
+
+def venue_cache_keys(venue_id):
+    # A venue is shown on its own page and on the pages of the artists that play there
+    artist_ids = db.session.query(Show.artist_id).filter(Show.venue_id == venue_id).distinct()
+    return [venue_key(venue_id)] + [artist_key(artist_id) for artist_id, in artist_ids]
+
+
+@venues_bp.route('/venues')
+@cache_policy(private=True, no_cache=True, etag=lambda: listing_version(Venue))
+def venues():
+    # Venues grouped by city,state along with their number of upcoming shows
+    data = venue_areas()
+
+    return render_template('pages/venues.html', areas=data)
+
+@venues_bp.route('/venues/search', methods=['POST'])
+def search_venues():
+    # search on venues with partial string search. Ensure it is case-insensitive.
+    search_term = request.form.get('search_term', '')
+    limit = request.form.get('limit', current_app.config['SEARCH_RESULTS_PER_PAGE'], type=int)
+    offset = request.form.get('offset', 0, type=int)
+    total, venues = search(Venue, search_term, limit, offset)
+
+    response={
+        "count": total,
+        "data": summaries(venues),
+        "limit": limit,
+        "offset": offset,
+    }
+
+    return render_template('pages/search_venues.html', results=response, search_term=request.form.get('search_term', ''))
+
+@venues_bp.route('/venues/<int:venue_id>')
+@cache_policy(private=True, no_cache=True)
+def show_venue(venue_id):
+    # shows the venue page with the given venue_id
+    data = venue_page_data(venue_id)
+
+    return render_template('pages/show_venue.html', venue=data)
+
+def venue_page_data(venue_id):
+    # Venue page view model, cached until its next show starts
+    data = cache.get(venue_key(venue_id))
+    if data is not None:
+        return data
+
+    # Read from the primary: the entry is shared with every client, and a page read from a
+    # lagging replica just after an edit would stay cached until it expires
+    now = g.now
+    with db.on_primary():
+        venue = venue_details(venue_id)
+        if venue is None:
+            abort(404)
+
+        # Get past and upcoming shows
+        past_shows, upcoming_shows = venue_shows(venue_id, now)
+
+    data = venue_page(venue, past_shows, upcoming_shows)
+    cache.set(venue_key(venue_id), data, page_timeout(upcoming_shows, now, current_app.config['CACHE_DEFAULT_TIMEOUT']))
+
+    return data
+
+#  Create Venue
+#  ----------------------------------------------------------------
+
+@venues_bp.route('/venues/create', methods=['GET'])
+def create_venue_form():
+    from .forms import VenueForm  # WTForms (and Babel, via Flask-WTF) load on first use
+
+    form = VenueForm()
+    return render_template('forms/new_venue.html', form=form)
+
+@venues_bp.route('/venues/create', methods=['POST'])
+def create_venue_submission():
+    error = False
+
+    try:
+        parsed_form = {
+            'name': request.form.get('name'),
+            'city': request.form.get('city'),
+            'state': request.form.get('state'),
+            'address': request.form.get('address'),
+            'phone': request.form.get('phone'),
+            'image_link': request.form.get('image_link'),
+            'facebook_link': request.form.get('facebook_link'),
+            'genres': request.form.getlist('genres'),
+            'seeking_description': request.form.get('seeking_description'),
+            'seeking_talent': True if request.form.get('seeking_talent') else False,
+            'website': request.form.get('website'),
+        }
+        venue = Venue(**parsed_form)
+        db.session.add(venue)
+        db.session.commit()
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful db insert, flash error
+        flash(f"Oops! Venue {request.form['name']} could not be listed.")
+    else:
+        # on successful db insert, flash success
+        flash(f"Venue {request.form['name']} was successfully listed!")
+
+    return render_template('pages/home.html')
+
+
+@venues_bp.route('/venues/<venue_id>', methods=['DELETE'])
+def delete_venue(venue_id):
+    error = False
+
+    try:
+        venue = Venue.query.get(venue_id)
+        stale_keys = venue_cache_keys(venue_id)
+        forget_venue_shows(venue_id)
+        # Delete the shows in the same transaction; the ORM would otherwise try to unset their
+        # venue_id, which is part of their primary key
+        db.session.query(Show).filter(Show.venue_id == venue_id).delete(synchronize_session=False)
+        db.session.delete(venue)
+        db.session.commit()
+        cache.delete(*stale_keys)
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful request, flash error
+        flash(f"Oops! Venue {venue_id} could not be deleted.")
+    else:
+        # on successful reques, flash success
+        flash(f"Venue {venue_id} was successfully deleted!")
+
+    return redirect(url_for('main.index'), code=303)
+
+#  Update
+#  ----------------------------------------------------------------
+
+@venues_bp.route('/venues/<int:venue_id>/edit', methods=['GET'])
+def edit_venue(venue_id):
+    from .forms import VenueForm
+
+    venue = Venue.query.get(venue_id)
+    if venue:
+        form = VenueForm(obj=venue)
+    else:
+        form = VenueForm()
+    return render_template('forms/edit_venue.html', form=form, venue=venue)
+
+@venues_bp.route('/venues/<int:venue_id>/edit', methods=['POST'])
+def edit_venue_submission(venue_id):
+    error = False
+    venue = Venue.query.get(venue_id)
+
+    try:
+        parsed_form = {
+            'name': request.form.get('name'),
+            'city': request.form.get('city'),
+            'state': request.form.get('state'),
+            'address': request.form.get('address'),
+            'phone': request.form.get('phone'),
+            'image_link': request.form.get('image_link'),
+            'facebook_link': request.form.get('facebook_link'),
+            'genres': request.form.getlist('genres'),
+            'seeking_description': request.form.get('seeking_description'),
+            'seeking_talent': True if request.form.get('seeking_talent') else False,
+            'website': request.form.get('website'),
+        }
+        venue.name = parsed_form.get('name')
+        venue.city = parsed_form.get('city')
+        venue.state = parsed_form.get('state')
+        venue.address = parsed_form.get('address')
+        venue.phone = parsed_form.get('phone')
+        venue.image_link = parsed_form.get('image_link')
+        venue.facebook_link = parsed_form.get('facebook_link')
+        venue.genres = parsed_form.get('genres')
+        venue.seeking_description = parsed_form.get('seeking_description')
+        venue.seeking_talent = parsed_form.get('seeking_talent')
+        venue.website = parsed_form.get('website')
+        db.session.commit()
+        cache.delete(*venue_cache_keys(venue_id))
+    except:
+        error = True
+        db.session.rollback()
+        print(sys.exc_info())
+    finally:
+        db.session.close()
+    if error:
+        # on unsuccessful db insert, flash error
+        flash(f"Oops! Venue {request.form['name']} could not be updated.")
+    else:
+        # on successful db insert, flash success
+        flash(f"Venue {request.form['name']} was successfully updated!")
+    return redirect(url_for('venues.show_venue', venue_id=venue_id))
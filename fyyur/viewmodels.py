@@ -0,0 +1,142 @@
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from .formatting import format_datetimes
+
+# Read-only page data built straight from column queries. Named tuples keep their values in
+# slots rather than a per-row __dict__, and are rendered the same way as dicts by the templates
+# (show.venue_name); as_dict() turns them into JSON for the API. Positional fields follow the
+# column order of the queries in queries.py so rows convert without per-field lookups.
+
+
+class Summary(NamedTuple):
+    id: int
+    name: str
+    num_upcoming_shows: int
+
+
+class Tile(NamedTuple):
+    # Listing entry; the version keys its cached fragment
+    id: int
+    name: str
+    num_upcoming_shows: int
+    version: int
+
+
+class VenueArea(NamedTuple):
+    city: str
+    state: str
+    venues: List[Tile]
+
+
+class VenueShow(NamedTuple):
+    artist_id: int
+    artist_name: str
+    artist_image_link: Optional[str]
+    start_time: datetime
+    start_time_text: str
+
+
+class ArtistShow(NamedTuple):
+    venue_id: int
+    venue_name: str
+    venue_image_link: Optional[str]
+    start_time: datetime
+    start_time_text: str
+
+
+class ShowItem(NamedTuple):
+    venue_id: int
+    venue_name: str
+    artist_id: int
+    artist_name: str
+    artist_image_link: Optional[str]
+    start_time: datetime
+    venue_version: int
+    artist_version: int
+    start_time_text: str
+
+
+class VenuePage(NamedTuple):
+    id: int
+    name: str
+    genres: List[str]
+    address: str
+    city: str
+    state: str
+    phone: str
+    website: Optional[str]
+    facebook_link: Optional[str]
+    seeking_talent: bool
+    seeking_description: Optional[str]
+    image_link: Optional[str]
+    past_shows: List[VenueShow]
+    upcoming_shows: List[VenueShow]
+    past_shows_count: int
+    upcoming_shows_count: int
+
+
+class ArtistPage(NamedTuple):
+    id: int
+    name: str
+    genres: List[str]
+    city: str
+    state: str
+    phone: str
+    website: Optional[str]
+    facebook_link: Optional[str]
+    seeking_venue: bool
+    seeking_description: Optional[str]
+    image_link: Optional[str]
+    past_shows: List[ArtistShow]
+    upcoming_shows: List[ArtistShow]
+    past_shows_count: int
+    upcoming_shows_count: int
+
+
+# Page fields read from the venue and artist tables, in order
+VENUE_FIELDS = VenuePage._fields[:VenuePage._fields.index('past_shows')]
+ARTIST_FIELDS = ArtistPage._fields[:ArtistPage._fields.index('past_shows')]
+
+# Show fields served by the API; the versions only key the cached show tiles
+SHOW_API_FIELDS = ShowItem._fields[:ShowItem._fields.index('venue_version')]
+
+
+def summaries(rows):
+    # Summaries from (id, name, num_upcoming_shows, ...) rows
+    return [Summary(row[0], row[1], row[2]) for row in rows]
+
+
+def with_start_times(view_model, shows):
+    # View models from show rows, with their start times formatted in one batch
+    start_times = format_datetimes([show.start_time for show in shows], 'full')
+    return [view_model(*show, start_time_text) for show, start_time_text in zip(shows, start_times)]
+
+
+def venue_page(venue, past_shows, upcoming_shows):
+    return VenuePage(
+        *venue,
+        past_shows=with_start_times(VenueShow, past_shows),
+        upcoming_shows=with_start_times(VenueShow, upcoming_shows),
+        past_shows_count=len(past_shows),
+        upcoming_shows_count=len(upcoming_shows),
+    )
+
+
+def artist_page(artist, past_shows, upcoming_shows):
+    return ArtistPage(
+        *artist,
+        past_shows=with_start_times(ArtistShow, past_shows),
+        upcoming_shows=with_start_times(ArtistShow, upcoming_shows),
+        past_shows_count=len(past_shows),
+        upcoming_shows_count=len(upcoming_shows),
+    )
+
+
+def as_dict(value):
+    # JSON-ready dicts and lists from (nested) view models
+    if hasattr(value, '_asdict'):
+        return {key: as_dict(item) for key, item in zip(value._fields, value)}
+    if isinstance(value, list):
+        return [as_dict(item) for item in value]
+    return value
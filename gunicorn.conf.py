@@ -0,0 +1,60 @@
+import gc
+import multiprocessing
+import os
+
+# gunicorn -c gunicorn.conf.py wsgi:app
+#
+# kill -HUP <master pid> reloads this file and replaces the workers gracefully: each finishes its
+# in-flight requests (up to graceful_timeout) while new ones take over. With preload_app the new
+# workers are forked from the app already imported by the master, so HUP does not pick up new
+# code; deploy code with USR2 (start a new master) then TERM to the old one, or set
+# GUNICORN_PRELOAD=false.
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', 5000)}")
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# 'gthread' or 'gevent'. A gthread worker serves GUNICORN_THREADS requests at a time, each
+# holding a thread while it waits on Postgres. A gevent worker serves up to
+# GUNICORN_WORKER_CONNECTIONS requests as greenlets, which yield to each other while psycopg2
+# waits for a query, so one process keeps up to DB_POOL_SIZE + DB_MAX_OVERFLOW slow searches
+# in flight; the requests beyond that queue for a connection (DB_POOL_TIMEOUT).
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+# Threads per worker; each may hold one of the worker's DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 200))
+
+if worker_class == 'gevent':
+    # Patch before the app is imported (preload_app), so that its locks, thread locals and
+    # connection pool are cooperative, and run psycopg2 in asynchronous mode with gevent
+    # waiting on its sockets
+    from gevent import monkey
+    monkey.patch_all()
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+# Import the app once in the master; workers share its memory copy-on-write
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+# Recycle workers now and then, staggered so they do not all restart at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    # Build the static assets once, before any worker serves a page that refers to them
+    import fyyur
+    from fyyur.assets import build_if_stale
+    build_if_stale(os.path.join(os.path.dirname(fyyur.__file__), 'static'))
+
+    if not server.cfg.preload_app:
+        return
+    # Connections opened while importing the app must not be shared by the forked workers
+    from wsgi import dispose_engines
+    dispose_engines()
+    # Keep the collector from touching, and so copying, the objects the workers share
+    gc.freeze()
@@ -0,0 +1,38 @@
+"""add trigram search indexes
+
+Revision ID: 3c9a1f07d2be
+Revises: 175040d562fd
+Create Date: 2026-10-18 09:12:41.318205
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9a1f07d2be'
+down_revision = '175040d562fd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # array_to_string is only STABLE, so wrap it to make genres usable in an index expression
+    op.execute("""
+        CREATE FUNCTION genres_text(character varying[]) RETURNS text
+        AS $$ SELECT array_to_string($1, ' ') $$
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    """)
+    for table in ('venue', 'artist'):
+        op.execute(f"""
+            CREATE INDEX ix_{table}_search_trgm ON {table}
+            USING gin ((name || ' ' || city || ' ' || state || ' ' || genres_text(genres)) gin_trgm_ops)
+        """)
+        op.execute(f'CREATE INDEX ix_{table}_name_trgm ON {table} USING gin (name gin_trgm_ops)')
+
+
+def downgrade():
+    for table in ('venue', 'artist'):
+        op.drop_index(f'ix_{table}_name_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_search_trgm', table_name=table)
+    op.execute('DROP FUNCTION genres_text(character varying[])')
@@ -0,0 +1,26 @@
+"""add venue and artist versions
+
+Revision ID: 5f2c8e1b7a94
+Revises: d4f81a2c6e39
+Create Date: 2026-10-18 16:02:37.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c8e1b7a94'
+down_revision = 'd4f81a2c6e39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('venue', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('artist', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    op.drop_column('artist', 'version')
+    op.drop_column('venue', 'version')
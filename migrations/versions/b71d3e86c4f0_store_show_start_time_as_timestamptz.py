@@ -0,0 +1,33 @@
+"""store show start_time as timestamptz
+
+Revision ID: b71d3e86c4f0
+Revises: 9e4b27c5a1d8
+Create Date: 2026-10-18 11:26:53.117042
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b71d3e86c4f0'
+down_revision = '9e4b27c5a1d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing show times were stored as naive UTC
+    op.alter_column('show', 'start_time',
+               existing_type=sa.DateTime(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               postgresql_using="start_time AT TIME ZONE 'UTC'")
+
+
+def downgrade():
+    op.alter_column('show', 'start_time',
+               existing_type=sa.DateTime(timezone=True),
+               type_=sa.DateTime(),
+               existing_nullable=False,
+               postgresql_using="start_time AT TIME ZONE 'UTC'")
@@ -0,0 +1,45 @@
+"""add upcoming show counters
+
+Revision ID: d4f81a2c6e39
+Revises: b71d3e86c4f0
+Create Date: 2026-10-18 13:41:08.552690
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f81a2c6e39'
+down_revision = 'b71d3e86c4f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('venue', sa.Column('upcoming_shows_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('artist', sa.Column('upcoming_shows_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('counter_sync',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Backfill the counters as of the initial sync time
+    op.execute('INSERT INTO counter_sync (id, synced_at) VALUES (1, now())')
+    for table, key in (('venue', 'venue_id'), ('artist', 'artist_id')):
+        op.execute(f"""
+            UPDATE {table} SET upcoming_shows_count = upcoming.count
+            FROM (
+                SELECT {key}, count(*) AS count FROM show
+                WHERE start_time > (SELECT synced_at FROM counter_sync)
+                GROUP BY {key}
+            ) AS upcoming
+            WHERE {table}.id = upcoming.{key}
+        """)
+
+
+def downgrade():
+    op.drop_table('counter_sync')
+    op.drop_column('artist', 'upcoming_shows_count')
+    op.drop_column('venue', 'upcoming_shows_count')
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask_migrate import upgrade, downgrade
+
+from fyyur import create_app
+from fyyur.assets import build_if_stale
+from fyyur.config import TestingConfig
+from fyyur.extensions import db, cache
+from fyyur.models import Venue, Artist, Show
+
+# The suite runs against TEST_DATABASE_URL, a scratch Postgres database that it migrates up
+# at the start and back down at the end:
+#   createdb fyyur_test && python -m pytest
+
+VENUE = {
+    'name': 'The Musical Hop', 'city': 'San Francisco', 'state': 'CA', 'address': '1015 Folsom Street',
+    'phone': '123-123-1234', 'genres': ['Jazz', 'Reggae'], 'image_link': 'https://example.com/venue.png',
+    'facebook_link': 'https://www.facebook.com/TheMusicalHop', 'website': 'https://www.themusicalhop.com',
+    'seeking_talent': True, 'seeking_description': 'Looking for local artists',
+}
+ARTIST = {
+    'name': 'Guns N Petals', 'city': 'San Francisco', 'state': 'CA', 'phone': '326-123-5000',
+    'genres': ['Rock n Roll'], 'image_link': 'https://example.com/artist.png',
+    'facebook_link': 'https://www.facebook.com/GunsNPetals', 'website': 'https://www.gunsnpetalsband.com',
+    'seeking_venue': False,
+}
+
+
+@pytest.fixture(scope='session')
+def app():
+    app = create_app(TestingConfig)
+    build_if_stale(app.static_folder)
+    with app.app_context():
+        upgrade()
+    yield app
+    with app.app_context():
+        downgrade(revision='base')
+
+
+@pytest.fixture(autouse=True)
+def clean(app):
+    # Every test starts from empty tables and caches
+    yield
+    with app.app_context():
+        db.session.remove()
+        for model in (Show, Venue, Artist):
+            db.session.query(model).delete()
+        db.session.commit()
+        cache.clear()
+        app.jinja_env.fragment_cache.clear()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_venue(app):
+    # Insert a venue and return its id
+    def make_venue(**fields):
+        with app.app_context():
+            venue = Venue(**dict(VENUE, **fields))
+            db.session.add(venue)
+            db.session.commit()
+            return venue.id
+    return make_venue
+
+
+@pytest.fixture
+def make_artist(app):
+    # Insert an artist and return its id
+    def make_artist(**fields):
+        with app.app_context():
+            artist = Artist(**dict(ARTIST, **fields))
+            db.session.add(artist)
+            db.session.commit()
+            return artist.id
+    return make_artist
+
+
+@pytest.fixture
+def make_show(app):
+    # Insert a show starting the given number of days from now
+    def make_show(artist_id, venue_id, days=7):
+        with app.app_context():
+            start_time = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=days)
+            db.session.add(Show(artist_id=artist_id, venue_id=venue_id, start_time=start_time))
+            db.session.commit()
+            return start_time
+    return make_show
@@ -0,0 +1,48 @@
+import os
+import shutil
+
+import pytest
+from flask import Flask
+
+from fyyur.assets import Assets, build_if_stale
+
+STATIC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fyyur', 'static')
+
+
+@pytest.fixture
+def static_folder(tmp_path):
+    # A copy of the sources under static/, without a build
+    folder = tmp_path / 'static'
+    shutil.copytree(STATIC, folder, ignore=shutil.ignore_patterns('dist'))
+    return str(folder)
+
+
+def test_build(static_folder):
+    manifest = build_if_stale(static_folder)
+
+    dist = os.path.join(static_folder, 'dist')
+    for name in ('bundle.css', 'head.js', 'bundle.js'):
+        assert os.path.isfile(os.path.join(dist, manifest[name]))
+        assert os.path.isfile(os.path.join(dist, manifest[name] + '.gz'))
+    leftovers = [file for _, _, files in os.walk(dist) for file in files if file.startswith('.tmp-')]
+    assert leftovers == []
+    assert build_if_stale(static_folder) == manifest
+
+
+def test_no_build_on_request_outside_debug(static_folder):
+    app = Flask(__name__, static_folder=static_folder)
+    Assets(app)
+
+    with app.test_request_context():
+        with pytest.raises(RuntimeError, match='flask assets build'):
+            app.jinja_env.globals['static_url']('bundle.css')
+    assert not os.path.exists(os.path.join(static_folder, 'dist'))
+
+
+def test_build_on_request_in_debug(static_folder):
+    app = Flask(__name__, static_folder=static_folder)
+    app.debug = True
+    Assets(app)
+
+    with app.test_request_context():
+        assert app.jinja_env.globals['static_url']('bundle.css').startswith('/static/dist/bundle.')
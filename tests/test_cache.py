@@ -0,0 +1,119 @@
+import fnmatch
+import importlib
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from fyyur import create_app
+from fyyur.cache import RedisCache, venue_key
+from fyyur.config import TestingConfig
+
+from conftest import VENUE
+
+
+class StubRedis:
+    # The part of the redis.Redis interface RedisCache uses, in memory
+
+    def __init__(self):
+        self.data = dict()
+
+    def get(self, key):
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match='*'):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+
+def test_redis_cache():
+    cache = RedisCache(StubRedis(), default_timeout=60)
+
+    cache.set('venue:1', {'name': 'The Musical Hop'})
+    assert cache.get('venue:1') == {'name': 'The Musical Hop'}
+    assert cache.client.get('fyyur:venue:1') is not None
+
+    cache.delete('venue:1')
+    assert cache.get('venue:1') is None
+
+    cache.set('venue:2', 'cleared')
+    cache.clear()
+    assert cache.client.data == {}
+
+
+@pytest.fixture
+def worker_apps():
+    # Two app instances, like two gunicorn workers, sharing one Redis
+    client = StubRedis()
+    apps = [create_app(TestingConfig, migrations=False) for _ in range(2)]
+    for app in apps:
+        app.extensions['cache']['CACHE_'] = RedisCache(client)
+    return apps, client
+
+
+def test_edit_evicts_page_in_other_instances(worker_apps, make_venue):
+    (writer, reader), client = worker_apps
+    venue_id = make_venue()
+
+    assert b'The Musical Hop' in reader.test_client().get(f'/venues/{venue_id}').data
+    assert client.get('fyyur:' + venue_key(venue_id)) is not None
+
+    response = writer.test_client().post(f'/venues/{venue_id}/edit', data=dict(VENUE, name='The Jazz Hop'))
+    assert response.status_code == 302
+    assert client.get('fyyur:' + venue_key(venue_id)) is None
+
+    assert b'The Jazz Hop' in reader.test_client().get(f'/venues/{venue_id}').data
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Moves the request time and the cache's clock forward together
+    offset = timedelta()
+
+    class Datetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + offset
+
+    class Time:
+        @staticmethod
+        def monotonic():
+            return time.monotonic() + offset.total_seconds()
+
+    def advance(seconds):
+        nonlocal offset
+        offset += timedelta(seconds=seconds)
+
+    # fyyur.cache is also the name of the cache extension object, so patch the modules directly
+    monkeypatch.setattr(importlib.import_module('fyyur.main'), 'datetime', Datetime)
+    monkeypatch.setattr(importlib.import_module('fyyur.cache'), 'time', Time)
+    return advance
+
+
+@pytest.mark.parametrize('kind', ['venues', 'artists'])
+def test_cached_page_expires_when_a_show_starts(client, clock, make_venue, make_artist, make_show, kind):
+    venue_id, artist_id = make_venue(), make_artist()
+    make_show(artist_id, venue_id, days=60 / 86400)
+    path = f'/{kind}/{venue_id if kind == "venues" else artist_id}'
+
+    page = client.get(path).data
+    assert b'1 Upcoming Show<' in page and b'0 Past Shows' in page
+
+    # Still before the show, within the page's timeout: served from the cache
+    clock(30)
+    assert client.get(path).data == page
+
+    # The show has started, well within the default timeout
+    clock(60)
+    page = client.get(path).data
+    assert b'0 Upcoming Shows' in page and b'1 Past Show<' in page
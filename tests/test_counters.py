@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fyyur.counters import sync_counters
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist, Show, CounterSync
+
+
+def set_synced_at(app, when):
+    with app.app_context():
+        db.session.query(CounterSync).update({CounterSync.synced_at: when})
+        db.session.commit()
+
+
+@pytest.fixture(autouse=True)
+def now(app):
+    # Counters count the shows after the last sync: start every test synced up to now
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    set_synced_at(app, now)
+    yield now
+    set_synced_at(app, datetime.now(timezone.utc))
+
+
+@pytest.fixture
+def create_show(client, now):
+    # Book a show through the form, which keeps the counters
+    def create_show(artist_id, venue_id, days):
+        start_time = (now + timedelta(days=days)).isoformat()
+        response = client.post('/shows/create', data={'artist_id': artist_id, 'venue_id': venue_id, 'start_time': start_time})
+        assert response.status_code == 200
+    return create_show
+
+
+def counts(app, model, *ids):
+    with app.app_context():
+        return [db.session.query(model.upcoming_shows_count).filter(model.id == id).scalar() for id in ids]
+
+
+def check_counters(app, *args):
+    result = app.test_cli_runner().invoke(args=['counters', 'check', *args])
+    assert result.exit_code == 0
+    return result.output.splitlines()[-1]
+
+
+def test_new_shows(app, make_venue, make_artist, create_show):
+    venue_id, first, second = make_venue(), make_artist(), make_artist(name='Second')
+    create_show(first, venue_id, 2)
+    create_show(second, venue_id, 3)
+    create_show(second, venue_id, -2)
+
+    assert counts(app, Venue, venue_id) == [2]
+    assert counts(app, Artist, first, second) == [1, 1]
+    assert check_counters(app) == '0 counters drifted.'
+
+
+def test_sync_uncounts_started_shows(app, now, make_venue, make_artist, create_show):
+    venue_id, artist_id = make_venue(), make_artist()
+    create_show(artist_id, venue_id, 2)
+    create_show(artist_id, venue_id, 5)
+
+    with app.app_context():
+        assert sync_counters(now + timedelta(days=3)) == 1
+        assert sync_counters(now + timedelta(days=3)) == 0
+
+    assert counts(app, Venue, venue_id) == [1]
+    assert counts(app, Artist, artist_id) == [1]
+    assert check_counters(app) == '0 counters drifted.'
+
+
+def test_delete_venue_with_shows(app, client, make_venue, make_artist, create_show):
+    venue_id, other_venue_id = make_venue(), make_venue(name='Other Venue')
+    first, second = make_artist(), make_artist(name='Second')
+    create_show(first, venue_id, 2)
+    create_show(first, venue_id, -2)
+    create_show(second, venue_id, 4)
+    create_show(first, other_venue_id, 6)
+
+    assert client.delete(f'/venues/{venue_id}').status_code == 303
+
+    with app.app_context():
+        assert db.session.query(Venue).get(venue_id) is None
+        assert db.session.query(Show).filter(Show.venue_id == venue_id).count() == 0
+    assert counts(app, Artist, first, second) == [1, 0]
+    assert counts(app, Venue, other_venue_id) == [1]
+    assert check_counters(app) == '0 counters drifted.'
+
+
+def test_check_fixes_drift(app, make_venue, make_artist, make_show):
+    # make_show inserts without counting
+    venue_id, artist_id = make_venue(), make_artist()
+    make_show(artist_id, venue_id, days=2)
+
+    assert check_counters(app) == '2 counters drifted.'
+    assert check_counters(app, '--fix') == '2 counters drifted, fixed.'
+    assert counts(app, Venue, venue_id) == [1]
+    assert counts(app, Artist, artist_id) == [1]
+    assert check_counters(app) == '0 counters drifted.'
@@ -0,0 +1,91 @@
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fyyur.exporter import generate_export
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist, Show
+
+# Columns that the database assigns, and which are not imported
+GENERATED = {'id', 'upcoming_shows_count', 'version'}
+
+
+def table_rows(app, model):
+    with app.app_context():
+        columns = [column for column in model.__table__.columns if column.name not in GENERATED]
+        return sorted(tuple(row) for row in db.session.query(*columns))
+
+
+def delete_all(app, *models):
+    with app.app_context():
+        for model in models:
+            db.session.query(model).delete()
+        db.session.commit()
+
+
+def export_and_import(app, client, entity, format, *delete):
+    exported = client.get(f'/export/{entity}.{format}')
+    assert exported.is_streamed
+    # Read the whole stream before deleting: its rows come from a server-side cursor, which the
+    # deleting transaction's commit closes
+    data = exported.get_data()
+    delete_all(app, *delete)
+    return client.post(f'/import/{entity}?format={format}', data=data).get_json()
+
+
+@pytest.mark.parametrize('format', ['csv', 'ndjson'])
+def test_round_trip(app, client, make_venue, make_artist, make_show, format):
+    venue_id = make_venue()
+    make_venue(name='No Links', facebook_link=None, website=None, seeking_description=None, seeking_talent=False)
+    artist_id = make_artist()
+    make_artist(name='No Links', facebook_link=None, website=None, genres=['Folk', 'Blues'])
+    make_show(artist_id, venue_id, days=-3)
+    make_show(artist_id, venue_id, days=3)
+    before = {model: table_rows(app, model) for model in (Venue, Artist, Show)}
+
+    # Shows refer to venue and artist ids, which are assigned anew on import: re-import them first
+    result = export_and_import(app, client, 'shows', format, Show)
+    assert result == {'inserted': 2, 'rejected': 0, 'errors': []}
+    assert table_rows(app, Show) == before[Show]
+
+    for entity, model in (('venues', Venue), ('artists', Artist)):
+        result = export_and_import(app, client, entity, format, Show, model)
+        assert result == {'inserted': 2, 'rejected': 0, 'errors': []}
+        assert table_rows(app, model) == before[model]
+
+
+def seed_shows(app, venue_id, artist_id, count):
+    start_time = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    with app.app_context():
+        db.session.execute(Show.__table__.insert(), [
+            {'artist_id': artist_id, 'venue_id': venue_id, 'start_time': start_time + timedelta(minutes=i)}
+            for i in range(count)
+        ])
+        db.session.commit()
+
+
+def export_peak_memory(app, format):
+    # Peak bytes allocated while exporting every show
+    with app.app_context():
+        tracemalloc.start()
+        try:
+            for _ in generate_export('shows', format, batch_size=100):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+@pytest.mark.parametrize('format', ['csv', 'ndjson'])
+def test_export_memory_is_bounded(app, make_venue, make_artist, format):
+    venue_id, artist_id = make_venue(), make_artist()
+    seed_shows(app, venue_id, artist_id, 500)
+    export_peak_memory(app, format)  # warm up the query compilation and type caches
+    small = export_peak_memory(app, format)
+
+    seed_shows(app, make_venue(name='Other Venue'), artist_id, 9500)
+    large = export_peak_memory(app, format)
+
+    # 20 times the rows, in batches of 100: memory stays at a batch's worth
+    assert large < small * 2
@@ -0,0 +1,21 @@
+def test_head_has_the_headers_of_get(client, make_venue):
+    make_venue()
+
+    for path in ('/', '/venues', '/shows'):
+        get = client.get(path)
+        head = client.head(path, headers={'Accept-Encoding': 'gzip'})
+
+        assert head.status_code == 200
+        assert head.data == b''
+        assert 'Content-Encoding' not in head.headers
+        assert head.headers['Content-Length'] == get.headers['Content-Length'] == str(len(get.data))
+        # Only a data version ETag set by the view; none hashed from the empty body
+        assert head.headers.get('ETag') == (get.headers['ETag'] if path == '/venues' else None)
+
+
+def test_get_etag_and_compression(client):
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'].startswith('W/"')
+    assert client.get('/', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
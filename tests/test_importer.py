@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from fyyur.importer import validate_row
+
+
+def import_ndjson(client, entity, rows):
+    body = ''.join(json.dumps(row) + '\n' for row in rows)
+    return client.post(f'/import/{entity}?format=ndjson', data=body).get_json()
+
+
+@pytest.mark.parametrize('row', [
+    {'artist_id': 1, 'venue_id': 2},
+    {'artist_id': 1, 'venue_id': 2, 'start_time': None},
+    {'artist_id': 1, 'venue_id': 2, 'start_time': ' '},
+])
+def test_show_needs_start_time(app, row):
+    with app.test_request_context():
+        values, errors = validate_row('shows', row)
+
+    assert values is None
+    assert errors == {'start_time': ['This field is required.']}
+
+
+def test_import_shows(client, make_venue, make_artist):
+    venue_id, artist_id = make_venue(), make_artist()
+
+    result = import_ndjson(client, 'shows', [
+        {'artist_id': artist_id, 'venue_id': venue_id, 'start_time': '2030-11-01 20:00:00'},
+        {'artist_id': artist_id, 'venue_id': venue_id},
+    ])
+
+    assert result['inserted'] == 1
+    assert result['errors'] == [{'line': 2, 'errors': {'start_time': ['This field is required.']}}]
+
+
+def test_tour_dates_need_start_time(client, make_venue, make_artist):
+    venue_id, artist_id = make_venue(), make_artist()
+
+    response = client.post('/api/v1/tours', json={'artist_id': artist_id, 'dates': [{'venue_id': venue_id}]})
+
+    assert response.status_code == 422
+    assert response.get_json()['errors'] == [{'index': 0, 'errors': {'start_time': ['This field is required.']}}]
@@ -0,0 +1,24 @@
+def test_venue_search_form_on_venue_pages(client, make_venue):
+    venue_id = make_venue()
+
+    for response in (client.get('/venues'), client.get(f'/venues/{venue_id}'),
+                     client.post('/venues/search', data={'search_term': 'hop'})):
+        assert response.status_code == 200
+        assert b'placeholder="Find a venue"' in response.data
+        assert b'placeholder="Find an artist"' not in response.data
+
+
+def test_artist_search_form_on_artist_pages(client, make_artist):
+    artist_id = make_artist()
+
+    for response in (client.get('/artists'), client.get(f'/artists/{artist_id}'),
+                     client.post('/artists/search', data={'search_term': 'guns'})):
+        assert response.status_code == 200
+        assert b'placeholder="Find an artist"' in response.data
+        assert b'placeholder="Find a venue"' not in response.data
+
+
+def test_active_tab(client):
+    for path, label in (('/venues', b'Venues'), ('/artists', b'Artists'), ('/shows', b'Shows')):
+        response = client.get(path)
+        assert b'class="active" ><a href="%s">%s</a>' % (path.encode(), label) in response.data
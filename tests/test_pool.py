@@ -0,0 +1,51 @@
+import logging
+import sqlite3
+import threading
+import time
+
+from fyyur.pool import MeteredQueuePool
+
+
+def slow_connect():
+    time.sleep(0.2)
+    return sqlite3.connect(':memory:', check_same_thread=False)
+
+
+def test_opening_a_connection_is_not_a_wait():
+    pool = MeteredQueuePool(slow_connect, pool_size=2, max_overflow=0)
+    pool.connect().close()
+
+    stats = pool.stats()
+    assert stats['checkouts'] == 1
+    assert stats['overflow'] == 0
+    assert stats['wait_seconds_max'] < 0.1
+
+
+def test_wait_for_a_checked_out_connection():
+    pool = MeteredQueuePool(slow_connect, pool_size=1, max_overflow=0)
+    connection = pool.connect()
+    threading.Timer(0.3, connection.close).start()
+
+    pool.connect().close()
+    stats = pool.stats()
+    assert stats['checkouts'] == 2
+    assert 0.25 <= stats['wait_seconds_max'] < 0.5
+    assert stats['failed_checkouts'] == 0
+
+
+def test_pool_messages_stay_out_of_the_app_log(app):
+    records = list()
+    handler = logging.Handler(logging.DEBUG)
+    handler.emit = records.append
+    app.logger.addHandler(handler)
+    level = app.logger.level
+    app.logger.setLevel(logging.DEBUG)
+    try:
+        pool = MeteredQueuePool(slow_connect, pool_size=1, max_overflow=0)
+        pool.connect().close()
+        pool.connect().close()
+    finally:
+        app.logger.setLevel(level)
+        app.logger.removeHandler(handler)
+
+    assert records == []
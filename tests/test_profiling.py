@@ -0,0 +1,26 @@
+from copy import deepcopy
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from fyyur.extensions import db
+
+
+def test_failed_statement_leaves_no_state(app):
+    with app.app_context():
+        with db.engine.connect() as connection:
+            connection.execute('SELECT 1')
+            info = deepcopy(connection.info)
+            for _ in range(3):
+                with pytest.raises(DBAPIError):
+                    connection.execute('SELECT * FROM no_such_table')
+            assert connection.info == info
+            assert connection.execute('SELECT 1').scalar() == 1
+
+
+def test_server_timing(client, make_venue):
+    make_venue()
+
+    response = client.get('/venues')
+    assert 'desc="2 queries"' in response.headers['Server-Timing']
+    assert 'fyyur_request_queries_count{endpoint="venues.venues"}' in client.get('/metrics').get_data(as_text=True)
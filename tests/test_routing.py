@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import event
+
+from fyyur import create_app
+from fyyur.config import TestingConfig
+from fyyur.extensions import db
+
+
+class ReplicaConfig(TestingConfig):
+    # The test database again, through a separate replica engine
+    SQLALCHEMY_REPLICA_URIS = [TestingConfig.SQLALCHEMY_DATABASE_URI]
+
+
+@pytest.fixture
+def replica_app():
+    return create_app(ReplicaConfig, migrations=False)
+
+
+def replica_statements(app):
+    # Statements run on the replica engine, appended as they execute
+    statements = list()
+    with app.app_context():
+        engine = db.get_engine(app, bind=db.replica_keys[0])
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_page_cache_filled_from_primary(replica_app, make_venue, make_artist, make_show):
+    venue_id, artist_id = make_venue(), make_artist()
+    make_show(artist_id, venue_id)
+    statements = replica_statements(replica_app)
+    client = replica_app.test_client()
+
+    for path in (f'/venues/{venue_id}', f'/artists/{artist_id}', f'/api/v1/venues/{venue_id}'):
+        assert client.get(path).status_code == 200
+    assert statements == []
+
+    # Listings still read from the replica
+    assert client.get('/venues').status_code == 200
+    assert statements
@@ -0,0 +1,52 @@
+from fyyur.extensions import db
+from fyyur.models import Venue, Artist
+from fyyur.queries import search
+
+
+def search_names(app, model, term, limit=10, offset=0):
+    with app.app_context():
+        total, rows = search(model, term, limit, offset)
+        db.session.remove()
+    return total, [row.name for row in rows]
+
+
+def test_city_and_state(app, make_venue):
+    make_venue(name='The Musical Hop')
+    make_venue(name='Park Square Live Music & Coffee')
+    make_venue(name='The Dueling Pianos Bar', city='New York', state='NY')
+    make_venue(name='San Francisco Hall', city='Oakland')
+
+    # Every word must match, in any of the name, city or state
+    total, names = search_names(app, Venue, 'San Francisco, CA')
+    assert total == 3
+    assert sorted(names) == ['Park Square Live Music & Coffee', 'San Francisco Hall', 'The Musical Hop']
+    assert search_names(app, Venue, 'NY')[1] == ['The Dueling Pianos Bar']
+
+
+def test_genres(app, make_artist):
+    make_artist(name='Guns N Petals', genres=['Rock n Roll'])
+    make_artist(name='Matt Quevedo', genres=['Jazz'])
+    make_artist(name='The Wild Sax Band', genres=['Jazz', 'Classical'])
+
+    assert search_names(app, Artist, 'jazz') == (2, ['Matt Quevedo', 'The Wild Sax Band'])
+    assert search_names(app, Artist, 'classical sax')[1] == ['The Wild Sax Band']
+    assert search_names(app, Artist, 'jazz rock') == (0, [])
+
+
+def test_ranked_by_name_similarity(app, make_venue):
+    for name in ('Musical Hop Warehouse District', 'The Musical Hop', 'Musical Hop'):
+        make_venue(name=name)
+
+    assert search_names(app, Venue, 'musical hop')[1] == ['Musical Hop', 'The Musical Hop', 'Musical Hop Warehouse District']
+
+
+def test_paging(app, client, make_artist):
+    for i in range(5):
+        make_artist(name=f'Band {i}')
+
+    assert search_names(app, Artist, 'band', limit=2, offset=2) == (5, ['Band 2', 'Band 3'])
+    assert search_names(app, Artist, 'band', limit=2, offset=4) == (5, ['Band 4'])
+
+    page = client.get('/api/v1/artists/search?q=band&per_page=2&page=3').get_json()
+    assert page['count'] == 5
+    assert [artist['name'] for artist in page['data']] == ['Band 4']
@@ -0,0 +1,35 @@
+import pytest
+
+
+@pytest.mark.parametrize('query', [
+    'from=notadate', 'to=2030-13-01', 'venue_id=abc', 'artist_id=1.5', 'when=soon', 'cursor=notacursor',
+])
+@pytest.mark.parametrize('path', ['/shows', '/api/v1/shows'])
+def test_invalid_filters(client, path, query):
+    assert client.get(f'{path}?{query}').status_code == 400
+
+
+def test_filters(client, make_venue, make_artist, make_show):
+    venue_id, other_venue_id, artist_id = make_venue(), make_venue(name='Other Venue'), make_artist()
+    make_show(artist_id, venue_id, days=3)
+    make_show(artist_id, venue_id, days=-3)
+    make_show(artist_id, other_venue_id, days=5)
+
+    def venue_ids(query):
+        response = client.get(f'/api/v1/shows?{query}')
+        assert response.status_code == 200
+        return sorted(show['venue_id'] for show in response.get_json()['data'])
+
+    assert venue_ids('') == sorted([venue_id, venue_id, other_venue_id])
+    assert venue_ids(f'venue_id={venue_id}') == [venue_id, venue_id]
+    assert venue_ids(f'venue_id={venue_id}&when=upcoming') == [venue_id]
+    assert venue_ids('from=2000-01-01&to=2000-01-02') == []
+    # Empty values, as sent by a blank filter form, are no filter
+    assert venue_ids('from=&to=&venue_id=&when=') == sorted([venue_id, venue_id, other_venue_id])
+
+
+def test_api_show_fields(client, make_venue, make_artist, make_show):
+    make_show(make_artist(), make_venue())
+
+    show, = client.get('/api/v1/shows').get_json()['data']
+    assert set(show) == {'venue_id', 'venue_name', 'artist_id', 'artist_name', 'artist_image_link', 'start_time'}
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from fyyur.extensions import db
+
+
+@contextmanager
+def count_statements(app):
+    # The SQL statements executed in the block, appended as they run
+    statements = list()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def populate(make_venue, make_artist, make_show, count):
+    venue_ids = [make_venue(name=f'Venue {i}', city=f'City {i % 3}') for i in range(count)]
+    artist_ids = [make_artist(name=f'Artist {i}') for i in range(count)]
+    for venue_id in venue_ids:
+        for artist_id in artist_ids:
+            make_show(artist_id, venue_id, days=venue_id % 5 - 2)
+    return venue_ids, artist_ids
+
+
+# The listing's data version (ETag) and the listing itself
+@pytest.mark.parametrize('path', ['/venues', '/artists'])
+@pytest.mark.parametrize('count', [1, 8])
+def test_listing_statements(app, client, make_venue, make_artist, make_show, path, count):
+    populate(make_venue, make_artist, make_show, count)
+
+    with count_statements(app) as statements:
+        assert client.get(path).status_code == 200
+    assert len(statements) == 2
+
+
+# The venue or artist, and all its past and upcoming shows; none once the page is cached
+@pytest.mark.parametrize('kind', ['venues', 'artists'])
+@pytest.mark.parametrize('count', [1, 8])
+def test_detail_page_statements(app, client, make_venue, make_artist, make_show, kind, count):
+    venue_ids, artist_ids = populate(make_venue, make_artist, make_show, count)
+    path = f'/{kind}/{(venue_ids if kind == "venues" else artist_ids)[0]}'
+
+    with count_statements(app) as statements:
+        assert client.get(path).status_code == 200
+    assert len(statements) == 2
+
+    with count_statements(app) as statements:
+        assert client.get(path).status_code == 200
+    assert statements == []
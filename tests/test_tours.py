@@ -0,0 +1,43 @@
+import pytest
+
+
+def post_tour(client, data):
+    return client.post('/api/v1/tours', json=data)
+
+
+def test_book_tour(client, make_venue, make_artist):
+    venue_id, artist_id = make_venue(), make_artist()
+
+    response = post_tour(client, {'artist_id': artist_id, 'dates': [
+        {'venue_id': venue_id, 'start_time': '2030-11-01 20:00:00'},
+        {'venue_id': venue_id, 'start_time': '2030-11-02 20:00:00'},
+    ]})
+
+    assert response.status_code == 201
+    assert response.get_json() == {'inserted': 2}
+
+
+@pytest.mark.parametrize('dates', [
+    ['2030-11-01T20:00', 3],
+    [['2030-11-01 20:00:00', 3]],
+    [None],
+])
+def test_reject_dates_that_are_not_objects(client, make_artist, dates):
+    artist_id = make_artist()
+
+    response = post_tour(client, {'artist_id': artist_id, 'dates': dates})
+
+    assert response.status_code == 422
+    errors = response.get_json()['errors']
+    assert [error['index'] for error in errors] == list(range(len(dates)))
+    assert all('date' in error['errors'] for error in errors)
+
+
+@pytest.mark.parametrize('dates', ['2030-11-01 20:00:00', {'venue_id': 1}, 3])
+def test_reject_dates_that_are_not_a_list(client, make_artist, dates):
+    response = post_tour(client, {'artist_id': make_artist(), 'dates': dates})
+
+    assert response.status_code == 422
+    assert response.get_json()['errors'] == [
+        {'index': 0, 'errors': {'dates': ['Must be a list of {"venue_id", "start_time"} objects.']}}
+    ]
@@ -0,0 +1,16 @@
+import os
+
+# The production settings, unless FYYUR_ENV says otherwise
+os.environ.setdefault('FYYUR_ENV', 'production')
+
+from fyyur import create_app  # noqa: E402
+from fyyur.extensions import db  # noqa: E402
+
+app = create_app(migrations=False)
+
+
+def dispose_engines():
+    # Close the pooled connections of the primary and the replicas, e.g. before forking workers
+    with app.app_context():
+        for bind in [None, *(app.config.get('SQLALCHEMY_BINDS') or ())]:
+            db.get_engine(app, bind).dispose()